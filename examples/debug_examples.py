@@ -4,6 +4,8 @@ Exemplo de uso do modo debug via código.
 Este exemplo mostra como ativar e usar o modo debug programaticamente.
 """
 
+import os
+from collections import Counter
 from pathlib import Path
 from mlbb_extractor import MLBBExtractor
 from mlbb_extractor.config import ExtractorConfig
@@ -53,6 +55,9 @@ def exemplo_debug_condicional():
     
     config = ExtractorConfig()
     config.debug_mode = False  # Inicialmente desligado
+    # Cache de OCR: o reprocessamento reaproveita o texto já reconhecido
+    # e apenas gera as imagens de debug
+    config.cache_dir = ".mlbb_cache"
     
     extractor = MLBBExtractor(config=config)
     
@@ -84,20 +89,24 @@ def exemplo_debug_lote():
     config.debug_mode = True
     config.debug_dir = "debug_lote"
     
-    extractor = MLBBExtractor(config=config)
-    
-    # Buscar todas as imagens
-    images_dir = Path("images")
-    image_files = list(images_dir.glob("*.png"))
+    # Buscar todas as imagens (uma única varredura do diretório)
+    with os.scandir("images") as entries:
+        image_files = [
+            entry.path for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".png")
+        ]
     
     all_results = []
     
-    for image_file in image_files:
-        print(f"Processando: {image_file.name}")
-        
-        # O nome da imagem será incluído automaticamente nos arquivos de debug
-        results = extractor.extract_all_players(str(image_file))
-        all_results.extend(results)
+    # As imagens de debug são gravadas em segundo plano; o bloco "with"
+    # garante que todas sejam gravadas ao final
+    with MLBBExtractor(config=config) as extractor:
+        for image_file in image_files:
+            print(f"Processando: {os.path.basename(image_file)}")
+            
+            # O nome da imagem será incluído automaticamente nos arquivos de debug
+            results = extractor.extract_all_players(image_file)
+            all_results.extend(results)
     
     print(f"\nTotal processado: {len(image_files)} imagens")
     print(f"Total jogadores: {len(all_results)}")
@@ -140,14 +149,13 @@ def exemplo_analise_debug():
     if debug_path.exists():
         debug_files = list(debug_path.glob("*.png"))
         
-        # Agrupar por tipo
-        tipos = {}
-        for f in debug_files:
-            # Extrair tipo do nome do arquivo
-            parts = f.stem.split("_")
-            if len(parts) >= 4:
-                tipo = parts[-2]  # Penúltimo componente (result, nickname, stats, etc.)
-                tipos[tipo] = tipos.get(tipo, 0) + 1
+        # Agrupar por tipo: penúltimo componente do nome do arquivo
+        # (result, nickname, stats, etc.)
+        tipos = Counter(
+            f.stem.rsplit("_", 2)[-2]
+            for f in debug_files
+            if f.stem.count("_") >= 3
+        )
         
         print("\nArquivos de debug gerados:")
         print("-" * 40)
@@ -26,21 +26,42 @@ Classes Principais:
 
 __version__ = "1.0.0"
 
-from .extractor.mlbb_extractor import (
-    MLBBExtractor,
-    GameData,
-    PlayerStats,
-    MatchInfo,
-    MedalType,
-)
 from .config import (
     ExtractorConfig,
     ResolutionProfile,
     RegionConfig,
     PlayerRegionConfig,
+    ProfileRegistry,
     DEFAULT_PROFILE,
 )
-from .preprocessor.image_processor import ImagePreprocessor
+from .cache import DiskCache
+
+# Módulos que dependem de OpenCV/Tesseract/NumPy são importados apenas no
+# primeiro acesso (PEP 562), para que quem só usa a configuração não pague
+# o custo de carregá-los
+_LAZY_EXPORTS = {
+    "MLBBExtractor": ".extractor.mlbb_extractor",
+    "GameData": ".extractor.mlbb_extractor",
+    "PlayerStats": ".extractor.mlbb_extractor",
+    "MatchInfo": ".extractor.mlbb_extractor",
+    "MedalType": ".extractor.mlbb_extractor",
+    "ImagePreprocessor": ".preprocessor.image_processor",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Classes principais
@@ -57,9 +78,11 @@ __all__ = [
     "ResolutionProfile",
     "RegionConfig",
     "PlayerRegionConfig",
+    "ProfileRegistry",
     "DEFAULT_PROFILE",
     
     # Utilitários
     "ImagePreprocessor",
+    "DiskCache",
 ]
 
@@ -0,0 +1,72 @@
+"""
+Cache em disco para resultados de OCR.
+
+As entradas são indexadas pelo hash do conteúdo (imagem processada +
+configuração do Tesseract), de modo que reprocessar a mesma screenshot
+reaproveita o texto já reconhecido em vez de chamar o Tesseract novamente.
+"""
+
+import os
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class DiskCache:
+    """
+    Cache de textos em disco indexado por chave de conteúdo.
+    
+    Cada entrada é gravada em um arquivo próprio (escrita atômica via
+    ``os.replace``), o que permite o uso concorrente por vários processos e
+    threads.
+    """
+
+    def __init__(self, cache_dir: str = ".mlbb_cache"):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache_dir: Diretório onde as entradas são armazenadas
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        """Retorna o caminho do arquivo de uma entrada."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Busca uma entrada no cache.
+
+        Args:
+            key: Chave da entrada
+
+        Returns:
+            Texto armazenado ou None se não existir
+        """
+        try:
+            return self._entry_path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Armazena uma entrada no cache.
+
+        Args:
+            key: Chave da entrada
+            value: Texto a ser armazenado
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(value, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Não deixa arquivos temporários órfãos no diretório do cache
+            tmp_path.unlink(missing_ok=True)
+            raise
@@ -0,0 +1,819 @@
+"""
+MLBB Image Data Extractor - Interface de Linha de Comando
+
+Este script extrai dados de jogadores de screenshots de final de partida
+do Mobile Legends Bang Bang.
+
+Modos de Operação:
+1. Busca por jogador específico (-p/--player)
+2. Extração de todos os jogadores (--all-players)
+
+Exemplos de Uso:
+    # Extrair dados de um jogador específico
+    python main.py -i screenshot.png -p "MTF7"
+    
+    # Extrair todos os jogadores
+    python main.py -i screenshot.png --all-players
+    
+    # Com caminho do Tesseract (se não estiver no PATH)
+    python main.py -i screenshot.png -p "MTF7" --tesseract-cmd "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+    
+    # Com arquivo de configuração personalizado
+    python main.py -i screenshot.png --all-players --config config.json
+    
+    # Gerar arquivo de configuração de exemplo
+    python main.py --generate-config
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing.util
+import os
+import queue
+import threading
+import sys
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional
+    orjson = None
+
+# Extensões de imagem aceitas no processamento em lote
+IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg'})
+
+# O pacote (OpenCV, Tesseract, NumPy) é importado apenas nos comandos que o
+# utilizam, para que --help e erros de argumentos respondam imediatamente
+if TYPE_CHECKING:
+    from mlbb_extractor import MLBBExtractor
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Constrói o parser de argumentos da CLI (criado uma única vez)."""
+    parser = argparse.ArgumentParser(
+        description="Extrai dados de jogadores de screenshots do MLBB",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  # Extrair dados de um jogador específico
+  python main.py -i screenshot.png -p MTF7
+
+  # Extrair todos os jogadores do time
+  python main.py -i screenshot.png --all-players
+
+  # Processar múltiplas imagens de um diretório
+  python main.py -d ./screenshots -p MTF7
+  python main.py -d ./screenshots --all-players
+
+  # Processar diretório com 4 processos em paralelo
+  python main.py -d ./screenshots --all-players --workers 4
+
+  # Especificar caminho do Tesseract
+  python main.py -i screenshot.png -p MTF7 --tesseract-cmd "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+
+  # Usar arquivo de configuração
+  python main.py -i screenshot.png --all-players --config resolutions/default.json
+
+  # Gerar arquivo de configuração de exemplo
+  python main.py --generate-config
+        """
+    )
+    
+    # Opções de entrada
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
+        "-i", "--image",
+        help="Caminho para uma única imagem de screenshot",
+    )
+    input_group.add_argument(
+        "-d", "--directory",
+        help="Caminho para diretório com múltiplas imagens (processamento em lote)",
+    )
+    
+    # Opções de extração de jogador
+    player_group = parser.add_mutually_exclusive_group()
+    player_group.add_argument(
+        "-p", "--player",
+        help="Nickname do jogador a ser buscado",
+    )
+    player_group.add_argument(
+        "--all-players",
+        action="store_true",
+        help="Extrair dados de todos os 5 jogadores do time aliado",
+    )
+    
+    # Opções de saída
+    parser.add_argument(
+        "-o", "--output",
+        default="output",
+        help="Diretório de saída (padrão: output)",
+    )
+    parser.add_argument(
+        "-n", "--name",
+        default="player_stats",
+        help="Nome base para os arquivos de saída (padrão: player_stats)",
+    )
+    
+    # Opções de configuração
+    parser.add_argument(
+        "--config",
+        help="Caminho para arquivo de configuração JSON (ex: resolutions/default.json)",
+    )
+    parser.add_argument(
+        "--tesseract-cmd",
+        help="Caminho para o executável do Tesseract (se não estiver no PATH)",
+    )
+    parser.add_argument(
+        "--profile",
+        help="Nome do perfil de resolução a ser usado",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="No processamento em lote, grava um resultado por linha (NDJSON) "
+             "em vez de um array JSON",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Número de processos para o processamento em lote "
+             "(padrão: 1 = sequencial)",
+    )
+    
+    # Utilitários
+    parser.add_argument(
+        "--generate-config",
+        action="store_true",
+        help="Gera um arquivo de configuração de exemplo",
+    )
+    parser.add_argument(
+        "--list-profiles",
+        action="store_true",
+        help="Lista os perfis de resolução disponíveis",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Ativa saída de debug",
+    )
+    
+    return parser
+
+
+def _positive_int(value: str) -> int:
+    """Tipo do argparse para inteiros maiores ou iguais a 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser um inteiro >= 1 (recebido: {value!r})")
+    return number
+
+
+def main(argv=None):
+    """
+    Função principal da CLI.
+    
+    Args:
+        argv: Lista de argumentos (padrão: ``sys.argv[1:]``). Permite chamar
+            a CLI repetidamente no mesmo processo reaproveitando o parser
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Diretórios criados em uma chamada anterior podem ter sido removidos
+    _dir_cache.clear()
+    
+    # Atalho para os comandos utilitários sem outros argumentos: dispensa a
+    # construção do parser (e a exigência de -i/-d do grupo de entrada)
+    if argv == ["--generate-config"]:
+        return generate_config()
+    if argv == ["--list-profiles"]:
+        return list_profiles()
+    
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    
+    # Comandos utilitários
+    if args.generate_config:
+        return generate_config()
+    
+    if args.list_profiles:
+        return list_profiles(args.config)
+    
+    # Validação de argumentos
+    if not args.player and not args.all_players:
+        parser.error("Especifique -p/--player para buscar um jogador ou --all-players para todos")
+    
+    # Regiões pequenas não se beneficiam do OpenMP do Tesseract, e iniciar
+    # as threads a cada chamada domina o tempo de OCR. Vale para este
+    # processo (tesserocr) e é herdado pelos do pytesseract e pelos workers;
+    # um valor definido pelo usuário prevalece
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    
+    # Executar extração
+    if args.directory:
+        return extract_from_directory(args)
+    else:
+        return extract_data(args)
+
+
+def generate_config() -> int:
+    """Gera um arquivo de configuração de exemplo."""
+    from mlbb_extractor.config import ExtractorConfig
+    
+    # Criar pasta resolutions
+    resolutions_dir = Path("resolutions")
+    resolutions_dir.mkdir(exist_ok=True)
+    
+    config = ExtractorConfig()
+    output_path = resolutions_dir / "default.json"
+    config.save_to_file(str(output_path))
+    
+    print(f"Arquivo de configuração gerado: {output_path}")
+    print("\nO arquivo contém:")
+    print("- Perfil padrão para resolução 2400x1080 (20:9 ultrawide)")
+    print("- Configurações de Tesseract e diretório de saída")
+    print("\nCrie novos arquivos em resolutions/ para diferentes resoluções:")
+    print("  resolutions/default.json    - Perfil padrão 2400x1080")
+    print("  resolutions/1920x1080.json  - Full HD 16:9")
+    print("  resolutions/custom.json     - Seu perfil personalizado")
+    print("\nUse com: --config resolutions/seu_arquivo.json")
+    
+    return 0
+
+
+def list_profiles(config_path: str = None) -> int:
+    """Lista os perfis de resolução disponíveis."""
+    from mlbb_extractor.config import ExtractorConfig
+    
+    print("Perfis de Resolução Disponíveis:")
+    print("=" * 50)
+    
+    resolutions_dir = Path("resolutions")
+    
+    if not resolutions_dir.exists():
+        print("\nPasta 'resolutions/' não encontrada.")
+        print("Execute: python main.py --generate-config")
+        return 1
+    
+    # Listar todos os arquivos JSON na pasta resolutions/
+    config_files = list(resolutions_dir.glob("*.json"))
+    
+    if not config_files:
+        print("\nNenhum arquivo de configuração encontrado em 'resolutions/'")
+        print("Execute: python main.py --generate-config")
+        return 1
+    
+    for config_file in sorted(config_files):
+        try:
+            config = ExtractorConfig(str(config_file))
+            
+            print(f"\n📁 {config_file.name}")
+            print("-" * 50)
+            
+            for name in config.list_profiles():
+                profile = config.profiles[name]
+                active = " ✓" if name == config.active_profile_name else ""
+                print(f"  • {name}{active}")
+                print(f"    Descrição: {profile.description}")
+                print(f"    Resolução: {profile.reference_width}x{profile.reference_height}")
+                print(f"    Aspect Ratio: {profile.reference_width/profile.reference_height:.2f}:1")
+        except Exception as e:
+            print(f"\n❌ Erro ao carregar {config_file.name}: {e}")
+    
+    print("\n" + "=" * 50)
+    print(f"Total: {len(config_files)} arquivo(s) de configuração")
+    print("\nUso: python main.py -i screenshot.png --all-players --config resolutions/arquivo.json")
+    
+    return 0
+
+
+def create_extractor(args, verbose: bool = True) -> MLBBExtractor:
+    """
+    Cria o extrator a partir dos argumentos da linha de comando.
+    
+    Args:
+        args: Argumentos da linha de comando
+        verbose: Se deve informar a ativação do modo debug
+        
+    Returns:
+        Instância configurada do MLBBExtractor
+    """
+    from mlbb_extractor import MLBBExtractor
+    from mlbb_extractor.config import ExtractorConfig
+    
+    # Carregar configuração
+    if args.config:
+        config = ExtractorConfig(args.config)
+    else:
+        config = ExtractorConfig()
+    
+    # Ativar modo debug se especificado
+    if args.debug:
+        config.debug_mode = True
+        if verbose:
+            print(f"🔍 Modo debug ativado - Salvando imagens em: {config.debug_dir}/")
+    
+    # Criar extrator
+    extractor = MLBBExtractor(
+        tesseract_cmd=args.tesseract_cmd,
+        config=config
+    )
+    
+    # Definir perfil se especificado
+    if args.profile:
+        extractor.config.set_active_profile(args.profile)
+    
+    return extractor
+
+
+def extract_data(args) -> int:
+    """
+    Executa a extração de dados de uma única imagem.
+    
+    Args:
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Código de saída (0 = sucesso, 1 = erro)
+    """
+    try:
+        with create_extractor(args) as extractor:
+            print(f"Processando imagem: {args.image}")
+            
+            if args.all_players:
+                return extract_all_players(extractor, args)
+            else:
+                return extract_single_player(extractor, args)
+            
+    except FileNotFoundError as e:
+        print(f"\nErro: Arquivo não encontrado - {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"\nErro: {e}", file=sys.stderr)
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+
+def extract_from_directory(args) -> int:
+    """
+    Executa a extração de dados de múltiplas imagens em um diretório.
+    
+    Args:
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Código de saída (0 = sucesso, 1 = erro)
+    """
+    from pathlib import Path
+    
+    try:
+        directory = Path(args.directory)
+        
+        if not directory.exists():
+            print(f"\nErro: Diretório não encontrado - {args.directory}", file=sys.stderr)
+            return 1
+        
+        if not directory.is_dir():
+            print(f"\nErro: {args.directory} não é um diretório", file=sys.stderr)
+            return 1
+        
+        # Buscar imagens no diretório (uma única varredura, sem diferenciar
+        # maiúsculas de minúsculas na extensão)
+        with os.scandir(directory) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file()
+                and entry.name.lower().rsplit('.', 1)[-1] in IMAGE_EXTENSIONS
+            ]
+        
+        if not image_files:
+            print(f"\nNenhuma imagem encontrada em: {args.directory}")
+            print("Extensões suportadas: .png, .jpg, .jpeg")
+            return 1
+        
+        image_files = sorted(image_files)
+        
+        print(f"Encontradas {len(image_files)} imagens em: {args.directory}")
+        print("=" * 50)
+        
+        # Processamento paralelo (o modo debug é sempre sequencial, pois os
+        # processos disputariam o diretório e o contador de imagens de debug)
+        workers = min(args.workers, len(image_files))
+        if args.debug:
+            workers = 1
+        
+        total_players = 0
+        success_count = 0
+        error_count = 0
+        total = len(image_files)
+        
+        # Cada resultado é gravado assim que fica pronto, sem acumular o lote
+        # inteiro em memória; uma interrupção preserva o que já foi extraído
+        extension = "ndjson" if args.ndjson else "json"
+        writer = _BulkWriter(
+            Path(args.output) / f"{args.name}_bulk.{extension}", ndjson=args.ndjson
+        )
+        
+        try:
+            if workers > 1:
+                print(f"Processando com {workers} processos em paralelo")
+                # Lotes de até 4 imagens por envio reduzem a troca de mensagens
+                # entre processos sem desbalancear a carga em diretórios pequenos
+                chunksize = max(1, min(4, total // (workers * 2)))
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(args,),
+                ) as executor:
+                    outcomes = executor.map(_process_one, image_files, chunksize=chunksize)
+                    for i, (image_file, (result, message)) in enumerate(
+                        zip(image_files, outcomes), 1
+                    ):
+                        sys.stdout.write(
+                            f"\n[{i}/{total}] Processando: {image_file.name}\n{message}\n"
+                        )
+                        if result is not None:
+                            writer.write(result)
+                            total_players += _count_players(result, args)
+                            success_count += 1
+                        else:
+                            error_count += 1
+            else:
+                with create_extractor(args) as extractor:
+                    # Os arquivos são lidos em uma thread à frente do OCR
+                    prefetched = _prefetch_files(image_files)
+                    for i, (image_file, data) in enumerate(prefetched, 1):
+                        print(f"\n[{i}/{total}] Processando: {image_file.name}")
+                        
+                        try:
+                            image = None
+                            if data is not None:
+                                image = extractor.preprocessor.decode_image(data, os.fspath(image_file))
+                            result, message = _extract_image(extractor, image_file, args, image)
+                        except Exception as e:
+                            result, message = None, f"  ✗ Erro: {e}"
+                            if args.debug:
+                                import traceback
+                                traceback.print_exc()
+                        
+                        print(message)
+                        if result is not None:
+                            writer.write(result)
+                            total_players += _count_players(result, args)
+                            success_count += 1
+                        else:
+                            error_count += 1
+        finally:
+            writer.close()
+        
+        # Resumo
+        print("\n" + "=" * 50)
+        print("Processamento Completo!")
+        print("=" * 50)
+        print(f"Total de imagens: {len(image_files)}")
+        print(f"Sucesso: {success_count}")
+        print(f"Erros: {error_count}")
+        
+        if success_count:
+            if args.all_players:
+                print(f"Total de partidas: {success_count}")
+                print(f"Total de jogadores extraídos: {total_players}")
+            
+            print(f"\nResultados exportados para: {writer.path}")
+            
+            return 0
+        else:
+            writer.path.unlink()
+            print("\nNenhum dado foi extraído.")
+            return 1
+            
+    except Exception as e:
+        print(f"\nErro: {e}", file=sys.stderr)
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+
+def _prefetch_files(paths: list, depth: int = 2):
+    """
+    Lê os arquivos em uma thread auxiliar, até ``depth`` à frente do consumo.
+    
+    A leitura do disco libera o GIL, então ela se sobrepõe ao OCR da
+    imagem anterior.
+    
+    Yields:
+        Tuplas (caminho, conteúdo em bytes ou None se a leitura falhar)
+    """
+    pending: queue.Queue = queue.Queue(maxsize=depth)
+    
+    def reader() -> None:
+        for path in paths:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                data = None
+            pending.put((path, data))
+    
+    threading.Thread(target=reader, daemon=True).start()
+    for _ in range(len(paths)):
+        yield pending.get()
+
+
+def _extract_image(extractor: MLBBExtractor, image_file: Path, args, image=None):
+    """
+    Extrai os dados de uma imagem do lote.
+    
+    Args:
+        extractor: Instância do MLBBExtractor
+        image_file: Caminho da imagem
+        args: Argumentos da linha de comando
+        image: Imagem já carregada (opcional; senão é lida de ``image_file``)
+        
+    Returns:
+        Tupla (resultado ou None, mensagem de status)
+    """
+    path_str = os.fspath(image_file)
+    
+    if args.all_players:
+        # Extrair todos os jogadores
+        match_data = extractor.extract_all_players(path_str, image=image)
+        
+        if match_data and match_data.get('my_team'):
+            # Adicionar nome do arquivo aos resultados
+            match_data['source_file'] = image_file.name
+            return match_data, f"  ✓ {len(match_data['my_team'])} jogadores extraídos"
+        return None, "  ✗ Nenhum dado extraído"
+    
+    # Buscar jogador específico
+    game_data = extractor.extract_game_data(path_str, args.player, image=image)
+    
+    if game_data:
+        result = game_data.to_dict()
+        result['source_file'] = image_file.name
+        mvp_text = " (MVP)" if result.get('is_mvp', False) else ""
+        return result, f"  ✓ Jogador '{args.player}' encontrado{mvp_text}"
+    return None, f"  ✗ Jogador '{args.player}' não encontrado"
+
+
+def _count_players(result, args) -> int:
+    """Retorna quantos jogadores um resultado do lote contém."""
+    return len(result['my_team']) if args.all_players else 0
+
+
+class _BulkWriter:
+    """
+    Grava os resultados do lote à medida que são produzidos.
+    
+    Em JSON, emite o mesmo array indentado de ``export_json``, um elemento
+    por vez; em NDJSON, um resultado compacto por linha.
+    """
+    
+    def __init__(self, path: Path, ndjson: bool = False):
+        self.path = path
+        self.ndjson = ndjson
+        self.count = 0
+        self._file = _write_output(path, lambda path: open(path, "wb"))
+        if not ndjson:
+            self._file.write(b"[")
+    
+    def write(self, result) -> None:
+        """Grava um resultado."""
+        if self.ndjson:
+            self._file.write(_dumps(result, indent=False) + b"\n")
+        else:
+            # Indenta o elemento um nível, como dentro de json.dump(indent=2)
+            separator = b",\n  " if self.count else b"\n  "
+            self._file.write(separator + _dumps(result).replace(b"\n", b"\n  "))
+        self.count += 1
+    
+    def close(self) -> None:
+        """Fecha o arquivo (finalizando o array JSON)."""
+        if not self.ndjson:
+            self._file.write(b"\n]" if self.count else b"]")
+        self._file.close()
+
+
+# Estado do processo worker (um extrator por processo)
+_worker_extractor = None
+_worker_args = None
+_worker_init_error = None
+
+
+def _init_worker(args) -> None:
+    """Inicializa o processo worker criando seu extrator uma única vez."""
+    global _worker_extractor, _worker_args, _worker_init_error
+    
+    _worker_args = args
+    
+    # O Tesseract usa OpenMP com todos os núcleos por padrão; com um processo
+    # por núcleo isso causa disputa de CPU. Definido antes de carregar o
+    # tesserocr e herdado pelos subprocessos do pytesseract
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    
+    try:
+        _worker_extractor = create_extractor(args, verbose=False)
+    except Exception as e:
+        _worker_init_error = e
+        return
+    
+    # Os workers terminam com os._exit (o atexit não roda); os finalizadores
+    # do multiprocessing rodam na saída do processo e liberam o extrator
+    multiprocessing.util.Finalize(None, _worker_extractor.close, exitpriority=10)
+
+
+def _process_one(image_file: Path):
+    """Processa uma imagem em um processo worker do lote."""
+    if _worker_init_error is not None:
+        return None, f"  ✗ Erro: {_worker_init_error}"
+    
+    try:
+        return _extract_image(_worker_extractor, image_file, _worker_args)
+    except Exception as e:
+        return None, f"  ✗ Erro: {e}"
+
+
+def extract_single_player(extractor: MLBBExtractor, args) -> int:
+    """
+    Extrai dados de um jogador específico.
+    
+    Args:
+        extractor: Instância do MLBBExtractor
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Código de saída
+    """
+    print(f"Buscando jogador: {args.player}")
+    
+    game_data = extractor.extract_game_data(args.image, args.player)
+    
+    if game_data is None:
+        print(f"\nJogador '{args.player}' não encontrado no screenshot.")
+        print("Certifique-se de que o nickname está correto (matches parciais são suportados).")
+        return 1
+    
+    result_dict = game_data.to_dict()
+    mvp_indicator = " 🏆 MVP" if result_dict.get('is_mvp', False) else "-"
+    
+    # Exibir resultados (relatório montado e escrito de uma vez)
+    lines = [
+        "",
+        "=" * 50,
+        "Extração Completa!",
+        "=" * 50,
+        "",
+        f"Jogador: {result_dict['nickname']}{mvp_indicator}",
+        f"  Kills: {result_dict['kills']}",
+        f"  Deaths: {result_dict['deaths']}",
+        f"  Assists: {result_dict['assists']}",
+        f"  Ouro: {result_dict['gold']}",
+        f"  Rating: {result_dict['ratio']}",
+        f"  Medalha: {result_dict['medal']}",
+        f"  MVP: {mvp_indicator.strip()}",
+        "",
+        "Informações da Partida:",
+        *_match_info_lines(result_dict),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Exportar
+    output_path = export_json(result_dict, args.output, args.name)
+    print(f"\nExportado para: {output_path}")
+    
+    return 0
+
+
+def extract_all_players(extractor: MLBBExtractor, args) -> int:
+    """
+    Extrai dados de todos os jogadores.
+    
+    Args:
+        extractor: Instância do MLBBExtractor
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Código de saída
+    """
+    print("Extraindo dados de todos os jogadores do time aliado...")
+    
+    results = extractor.extract_all_players(args.image)
+    
+    if not results or not results.get('my_team'):
+        print("Nenhum dado de jogador pôde ser extraído.")
+        return 1
+    
+    # Exibir resultados (relatório montado e escrito de uma vez)
+    lines = ["", "=" * 50, "Extração Completa!", "=" * 50]
+    
+    for player_data in results['my_team']:
+        mvp_indicator = " 🏆 MVP" if player_data.get('is_mvp', False) else "-"
+        hero_name = player_data.get('hero', 'NO_MATCH')
+        lines += [
+            "",
+            f"Jogador {player_data['position']}: {player_data['nickname']}{mvp_indicator}",
+            f"  Herói: {hero_name}",
+            f"  K/D/A: {player_data['kills']}/{player_data['deaths']}/{player_data['assists']}",
+            f"  Ouro: {player_data['gold']}",
+            f"  Rating: {player_data['ratio']}",
+            f"  Medalha: {player_data['medal']}",
+            f"  MVP: {mvp_indicator.strip()}",
+        ]
+    
+    # Informações da partida
+    lines += ["", "Informações da Partida:", *_match_info_lines(results)]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Exportar
+    output_path = export_json(results, args.output, args.name)
+    print(f"\nExportado para: {output_path}")
+    
+    return 0
+
+
+def _match_info_lines(data: dict) -> list:
+    """Linhas do relatório com as informações da partida."""
+    return [
+        f"  Resultado: {data['result']}",
+        f"  Placar: {data['my_team_score']} - {data['adversary_team_score']}",
+        f"  Duração: {data['duration']}",
+    ]
+
+
+# Diretórios de saída já criados nesta execução de ``main`` (caminhos
+# absolutos, pois os relativos dependem do diretório atual)
+_dir_cache: set = set()
+
+
+def _ensure_dir(path: Path, refresh: bool = False) -> None:
+    """
+    Cria o diretório (uma única vez por execução).
+    
+    Args:
+        path: Diretório a ser criado
+        refresh: Recriar mesmo se já registrado (ex: removido depois)
+    """
+    key = path.absolute()
+    if refresh or key not in _dir_cache:
+        path.mkdir(parents=True, exist_ok=True)
+        _dir_cache.add(key)
+
+
+def _write_output(path: Path, write):
+    """
+    Chama ``write(path)`` garantindo que o diretório de saída exista.
+    
+    Se o diretório registrado como criado tiver sido removido, ele é criado
+    de novo e a escrita é repetida.
+    """
+    _ensure_dir(path.parent)
+    try:
+        return write(path)
+    except FileNotFoundError:
+        _ensure_dir(path.parent, refresh=True)
+        return write(path)
+
+
+def export_json(data, output_dir: str, filename: str) -> str:
+    """
+    Exporta dados para arquivo JSON.
+    
+    Args:
+        data: Dados a serem exportados
+        output_dir: Diretório de saída
+        filename: Nome base do arquivo
+        
+    Returns:
+        Caminho do arquivo exportado
+    """
+    output_path = Path(output_dir) / f"{filename}.json"
+    content = _dumps(data)
+    _write_output(output_path, lambda path: path.write_bytes(content))
+    
+    return str(output_path)
+
+
+def _dumps(data, indent: bool = True) -> bytes:
+    """Serializa dados em JSON UTF-8 (orjson quando disponível)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
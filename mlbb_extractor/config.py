@@ -8,46 +8,82 @@ As coordenadas são definidas em porcentagem (0-100) para manter responsividade
 entre diferentes resoluções de imagem.
 """
 
+import os
+import copy
+import gzip
 import json
+import hashlib
+from collections.abc import MutableMapping
+from functools import cached_property, lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional
+    orjson = None
 
-@dataclass
+
+@dataclass(frozen=True)
 class RegionConfig:
-    """Configuração de uma região na imagem."""
+    """
+    Configuração de uma região na imagem (imutável).
+
+    Para ajustar uma região, crie uma nova com ``dataclasses.replace``
+    (ex: ``replace(regiao, x=12.5)``); atribuir ``regiao.x = ...`` gera
+    ``FrozenInstanceError``.
+    """
     x: float  # Posição X em porcentagem (0-100)
     y: float  # Posição Y em porcentagem (0-100)
     w: float  # Largura em porcentagem
     h: float  # Altura em porcentagem
 
+    def __post_init__(self) -> None:
+        # Frações (0-1) pré-calculadas para a conversão em pixels; mesma
+        # operação (valor / 100) de antes, então os pixels não mudam
+        object.__setattr__(self, "_fractions", (
+            self.x / 100, self.y / 100, self.w / 100, self.h / 100
+        ))
+
+    @cached_property
+    def _dict(self) -> Dict[str, float]:
+        return {"x": self.x, "y": self.y, "w": self.w, "h": self.h}
+
     def to_dict(self) -> Dict[str, float]:
-        return asdict(self)
+        return dict(self._dict)
     
     def to_pixels(self, image_width: int, image_height: int) -> Tuple[int, int, int, int]:
         """Converte coordenadas de porcentagem para pixels."""
-        px_x = int((self.x / 100) * image_width)
-        px_y = int((self.y / 100) * image_height)
-        px_w = int((self.w / 100) * image_width)
-        px_h = int((self.h / 100) * image_height)
-        return (px_x, px_y, px_w, px_h)
+        fx, fy, fw, fh = self._fractions
+        return (
+            int(fx * image_width),
+            int(fy * image_height),
+            int(fw * image_width),
+            int(fh * image_height),
+        )
     
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "RegionConfig":
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerRegionConfig:
-    """Configuração das regiões de um jogador."""
+    """
+    Configuração das regiões de um jogador (imutável).
+
+    Assim como ``RegionConfig``, é alterada por substituição:
+    ``profile.players[0] = replace(jogador, nickname=nova_regiao)``.
+    """
     nickname: RegionConfig
     stats: RegionConfig
     medal: RegionConfig
     ratio: RegionConfig
     hero: Optional[RegionConfig] = None
 
-    def to_dict(self) -> Dict[str, Dict[str, float]]:
+    @cached_property
+    def _dict(self) -> Dict[str, Dict[str, float]]:
         result = {
             "nickname": self.nickname.to_dict(),
             "stats": self.stats.to_dict(),
@@ -58,6 +94,9 @@ class PlayerRegionConfig:
             result["hero"] = self.hero.to_dict()
         return result
 
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(region) for name, region in self._dict.items()}
+
     @classmethod
     def from_dict(cls, data: Dict[str, Dict[str, float]]) -> "PlayerRegionConfig":
         return cls(
@@ -181,6 +220,134 @@ DEFAULT_PROFILE = ResolutionProfile(
 )
 
 
+class ProfileRegistry(MutableMapping):
+    """
+    Perfis de resolução indexados pelo nome.
+    
+    Perfis lidos de arquivo ficam como dicionário até o primeiro acesso, já
+    que normalmente apenas um deles é usado; ``reference_size`` permite
+    comparar resoluções sem construí-los.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Union[ResolutionProfile, Dict[str, Any]]] = {}
+        # Incrementado a cada alteração (invalida caches de quem consulta)
+        self.version = 0
+
+    def add_raw(self, data: Dict[str, Any]) -> None:
+        """Registra um perfil a partir do seu dicionário (não alterado)."""
+        self._entries[data["name"]] = data
+        self.version += 1
+
+    def reference_size(self, name: str) -> Tuple[int, int]:
+        """Retorna (largura, altura) de referência de um perfil."""
+        entry = self._entries[name]
+        if isinstance(entry, dict):
+            return entry["reference_width"], entry["reference_height"]
+        return entry.reference_width, entry.reference_height
+
+    def __getitem__(self, name: str) -> ResolutionProfile:
+        entry = self._entries[name]
+        if isinstance(entry, dict):
+            entry = self._entries[name] = ResolutionProfile.from_dict(entry)
+        return entry
+
+    def __setitem__(self, name: str, profile: ResolutionProfile) -> None:
+        self._entries[name] = profile
+        self.version += 1
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+        self.version += 1
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_REGION_KEYS = ("x", "y", "w", "h")
+_PROFILE_REGION_KEYS = (
+    "result_region", "my_team_score_region", "adversary_score_region", "duration_region",
+)
+_PLAYER_REGION_KEYS = ("nickname", "stats", "medal", "ratio")
+
+
+def _validate_region(data: Any, where: str) -> None:
+    """Verifica se ``data`` descreve uma região (x, y, w, h numéricos)."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{where}: região deve ser um objeto")
+    for key in _REGION_KEYS:
+        value = data.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{where}.{key}: valor numérico obrigatório")
+
+
+def _validate_config_data(data: Any) -> None:
+    """
+    Valida a estrutura de um arquivo de configuração.
+
+    Os perfis só são construídos no primeiro acesso; validar na leitura faz
+    com que um arquivo inválido gere um erro claro imediatamente.
+
+    Raises:
+        ValueError: Se a estrutura for inválida (indicando o campo)
+    """
+    if not isinstance(data, dict):
+        raise ValueError("configuração deve ser um objeto JSON")
+    profiles = data.get("profiles", [])
+    if not isinstance(profiles, list):
+        raise ValueError("profiles: deve ser uma lista")
+    for i, profile in enumerate(profiles):
+        where = f"profiles[{i}]"
+        if not isinstance(profile, dict):
+            raise ValueError(f"{where}: perfil deve ser um objeto")
+        for key in ("name", "description"):
+            if not isinstance(profile.get(key), str):
+                raise ValueError(f"{where}.{key}: texto obrigatório")
+        where = f"profiles[{profile['name']!r}]"
+        for key in ("reference_width", "reference_height"):
+            value = profile.get(key)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"{where}.{key}: número positivo obrigatório")
+        for key in _PROFILE_REGION_KEYS:
+            _validate_region(profile.get(key), f"{where}.{key}")
+        players = profile.get("players")
+        if not isinstance(players, list):
+            raise ValueError(f"{where}.players: deve ser uma lista")
+        for j, player in enumerate(players):
+            player_where = f"{where}.players[{j}]"
+            if not isinstance(player, dict):
+                raise ValueError(f"{player_where}: jogador deve ser um objeto")
+            for key in _PLAYER_REGION_KEYS:
+                _validate_region(player.get(key), f"{player_where}.{key}")
+            if "hero" in player:
+                _validate_region(player["hero"], f"{player_where}.hero")
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lê e interpreta um arquivo de configuração JSON, com cache.
+
+    ``mtime_ns`` e ``size`` fazem parte da chave para que alterações no
+    arquivo invalidem a entrada (o tamanho cobre reescritas dentro da
+    resolução do timestamp). O dicionário retornado é compartilhado e não
+    deve ser alterado.
+    A validação roda apenas uma vez por versão do arquivo.
+    """
+    content = Path(path_str).read_bytes()
+    if content[:2] == b"\x1f\x8b":  # arquivo compactado (.json.gz)
+        content = gzip.decompress(content)
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+    _validate_config_data(data)
+    return data
+
+
 class ExtractorConfig:
     """
     Gerenciador de configuração do extrator.
@@ -195,14 +362,24 @@ class ExtractorConfig:
         Args:
             config_path: Caminho opcional para arquivo de configuração JSON
         """
-        self.profiles: Dict[str, ResolutionProfile] = {
-            DEFAULT_PROFILE.name: DEFAULT_PROFILE
-        }
+        self.profiles = ProfileRegistry()
+        self.profiles[DEFAULT_PROFILE.name] = DEFAULT_PROFILE
+        self._active_cache: Optional[Tuple[str, int, ResolutionProfile]] = None
+        # Perfil escolhido por resolução de imagem (versão dos perfis, mapa)
+        self._auto_select_cache: Tuple[int, Dict[Tuple[int, int], str]] = (-1, {})
+        # Último conteúdo gravado por arquivo: caminho -> (hash, mtime_ns)
+        self._saved_files: Dict[str, Tuple[bytes, int]] = {}
         self.active_profile_name: str = DEFAULT_PROFILE.name
         self.tesseract_cmd: Optional[str] = None
         self.output_dir: str = "output"
         self.debug_mode: bool = False
         self.debug_dir: str = "debug"
+        self.batch_ocr: bool = False
+        self.cache_dir: Optional[str] = None
+        self.use_tesserocr: bool = True
+        self.ocr_threads: int = 1
+        self.fast_nickname_search: bool = False
+        self.downscale_large_images: bool = False
         
         if config_path:
             self.load_from_file(config_path)
@@ -210,7 +387,16 @@ class ExtractorConfig:
     @property
     def active_profile(self) -> ResolutionProfile:
         """Retorna o perfil de resolução ativo."""
-        return self.profiles[self.active_profile_name]
+        # Consultado a cada região extraída: memoizado enquanto o nome ativo
+        # e o conjunto de perfis não mudarem
+        cached = self._active_cache
+        if (cached is None or cached[0] != self.active_profile_name
+                or cached[1] != self.profiles.version):
+            profile = self.profiles[self.active_profile_name]
+            cached = self._active_cache = (
+                self.active_profile_name, self.profiles.version, profile
+            )
+        return cached[2]
 
     def set_active_profile(self, profile_name: str) -> None:
         """
@@ -262,25 +448,36 @@ class ExtractorConfig:
 
         Args:
             config_path: Caminho para o arquivo de configuração
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            ValueError: Se a estrutura do arquivo for inválida
         """
         path = Path(config_path)
         if not path.exists():
             raise FileNotFoundError(f"Arquivo de configuração não encontrado: {config_path}")
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        path = path.resolve()
+        stat = path.stat()
+        data = _load_config_cached(str(path), stat.st_mtime_ns, stat.st_size)
         
         # Carregar configurações gerais
         self.tesseract_cmd = data.get("tesseract_cmd")
         self.output_dir = data.get("output_dir", "output")
         self.debug_mode = data.get("debug_mode", False)
         self.debug_dir = data.get("debug_dir", "debug")
+        self.batch_ocr = data.get("batch_ocr", False)
+        self.cache_dir = data.get("cache_dir")
+        self.use_tesserocr = data.get("use_tesserocr", True)
+        self.ocr_threads = data.get("ocr_threads", 1)
+        self.fast_nickname_search = data.get("fast_nickname_search", False)
+        self.downscale_large_images = data.get("downscale_large_images", False)
         
         # Carregar perfis
         if "profiles" in data:
             for profile_data in data["profiles"]:
-                profile = ResolutionProfile.from_dict(profile_data)
-                self.profiles[profile.name] = profile
+                # Cópia: o dicionário em cache é compartilhado entre leituras
+                self.profiles.add_raw(copy.deepcopy(profile_data))
         
         # Definir perfil ativo
         if "active_profile" in data and data["active_profile"] in self.profiles:
@@ -290,6 +487,9 @@ class ExtractorConfig:
         """
         Salva configuração em um arquivo JSON.
 
+        Se o caminho terminar em ``.gz``, o JSON é gravado compacto e
+        compactado com gzip (menor para configurações com muitos perfis).
+
         Args:
             config_path: Caminho para salvar o arquivo de configuração
         """
@@ -301,12 +501,44 @@ class ExtractorConfig:
             "output_dir": self.output_dir,
             "debug_mode": self.debug_mode,
             "debug_dir": self.debug_dir,
+            "batch_ocr": self.batch_ocr,
+            "cache_dir": self.cache_dir,
+            "use_tesserocr": self.use_tesserocr,
+            "ocr_threads": self.ocr_threads,
+            "fast_nickname_search": self.fast_nickname_search,
+            "downscale_large_images": self.downscale_large_images,
             "active_profile": self.active_profile_name,
             "profiles": [p.to_dict() for p in self.profiles.values()],
         }
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        compressed = path.name.endswith(".gz")
+        if orjson is not None:
+            content = orjson.dumps(data, option=0 if compressed else orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(
+                data, indent=None if compressed else 2, ensure_ascii=False
+            ).encode("utf-8")
+        
+        # Não regravar se o arquivo ainda contém exatamente o que esta
+        # instância gravou por último (mesmo hash e não modificado depois)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        key = str(path.resolve())
+        saved = self._saved_files.get(key)
+        if saved is not None and saved[0] == digest:
+            try:
+                if path.stat().st_mtime_ns == saved[1]:
+                    return
+            except FileNotFoundError:
+                pass
+        
+        # Escrita atômica: leitores nunca veem um arquivo parcial
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        if compressed:
+            tmp_path.write_bytes(gzip.compress(content, compresslevel=1, mtime=0))
+        else:
+            tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        self._saved_files[key] = (digest, path.stat().st_mtime_ns)
 
     def create_sample_config(self, output_path: str = "resolutions/default.json") -> str:
         """
@@ -335,16 +567,29 @@ class ExtractorConfig:
         Returns:
             Nome do perfil selecionado
         """
+        # Em um lote as imagens costumam ter a mesma resolução: a escolha é
+        # memoizada por (largura, altura) enquanto os perfis não mudarem
+        version, selected = self._auto_select_cache
+        if version != self.profiles.version:
+            selected = {}
+            self._auto_select_cache = (self.profiles.version, selected)
+        best_profile = selected.get((image_width, image_height))
+        if best_profile is not None:
+            self.active_profile_name = best_profile
+            return best_profile
+        
         image_ratio = image_width / image_height
         best_profile = DEFAULT_PROFILE.name
         best_diff = float('inf')
         
-        for name, profile in self.profiles.items():
-            profile_ratio = profile.reference_width / profile.reference_height
+        for name in self.profiles:
+            reference_width, reference_height = self.profiles.reference_size(name)
+            profile_ratio = reference_width / reference_height
             diff = abs(image_ratio - profile_ratio)
             if diff < best_diff:
                 best_diff = diff
                 best_profile = name
         
+        selected[(image_width, image_height)] = best_profile
         self.active_profile_name = best_profile
         return best_profile
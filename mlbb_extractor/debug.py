@@ -0,0 +1,86 @@
+"""
+Gravação assíncrona de imagens de debug.
+
+A codificação PNG e a escrita em disco das imagens de debug são feitas em
+uma thread em segundo plano, para não bloquear o pipeline de OCR.
+"""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Union
+
+import cv2
+import numpy as np
+
+
+_STOP = object()
+
+
+class DebugWriter:
+    """
+    Grava imagens de debug em uma thread dedicada.
+    
+    As imagens são copiadas e enfileiradas em uma fila limitada (o que limita
+    o uso de memória); a thread consumidora codifica em PNG com compressão
+    rápida e grava o arquivo.
+    """
+
+    def __init__(self, maxsize: int = 64, png_compression: int = 1):
+        """
+        Inicializa o gravador e inicia a thread consumidora.
+
+        Args:
+            maxsize: Número máximo de imagens pendentes na fila
+            png_compression: Nível de compressão PNG (0-9)
+        """
+        self.png_compression = png_compression
+        self.q: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="mlbb-debug-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, path: Union[str, Path], image: np.ndarray) -> None:
+        """
+        Enfileira uma imagem para gravação.
+
+        Args:
+            path: Caminho do arquivo PNG
+            image: Imagem a ser gravada (é copiada)
+        """
+        self.q.put((str(path), image.copy()))
+
+    def flush(self) -> None:
+        """Aguarda a gravação de todas as imagens pendentes."""
+        self.q.join()
+
+    def close(self) -> None:
+        """Grava as imagens pendentes e encerra a thread consumidora."""
+        if self._thread.is_alive():
+            self.q.put(_STOP)
+            self._thread.join()
+
+    def _writer_loop(self) -> None:
+        """Consome a fila codificando e gravando as imagens."""
+        while True:
+            item = self.q.get()
+            try:
+                if item is _STOP:
+                    return
+                path, image = item
+                ok, buffer = cv2.imencode(
+                    ".png", image, [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression]
+                )
+                if ok:
+                    Path(path).write_bytes(buffer.tobytes())
+            except Exception as e:
+                print(f"Aviso: Erro ao salvar imagem de debug: {e}")
+            finally:
+                self.q.task_done()
+
+    def __enter__(self) -> "DebugWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -11,23 +11,48 @@ Funcionalidades:
 - Suporte a múltiplos perfis de resolução
 """
 
+import os
 import re
+import sys
 import cv2
 import json
+import hashlib
+import threading
 import numpy as np
-from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 from ..preprocessor.image_processor import ImagePreprocessor
+from ..cache import DiskCache
+from ..debug import DebugWriter
+from ..tesseract_api import TesseractAPI, TESSEROCR_AVAILABLE, tesseract_version
 from ..config import (
     ExtractorConfig, RegionConfig, PlayerRegionConfig, 
     ResolutionProfile, DEFAULT_PROFILE
 )
 
 
+# Padrões de parsing dos textos de OCR (compilados uma única vez)
+_DIGITS_RE = re.compile(r'\d+')
+_FLOAT_RE = re.compile(r'(\d+\.?\d*|\.\d+)')
+_DURATION_RE = re.compile(r'(\d{1,2}):(\d{2})')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_NON_NUMDOT_RE = re.compile(r'[^0-9.]')
+_PSM_RE = re.compile(r'--psm \d+')
+_NICK_LEADING_SYMBOLS_RE = re.compile(r'^[@#$%^&*()_+=\[\]{}|\\<>/?`~]+')
+_NICK_TRAILING_SYMBOLS_RE = re.compile(r'[@#$%^&*()_+=\[\]{}|\\<>/?`~]+$')
+_WHITESPACE_RE = re.compile(r'\s+')
+# "VICTOR" também cobre "VICTORY"
+_VICTORY_RE = re.compile(r'VICTOR|WIN', re.IGNORECASE)
+_DEFEAT_RE = re.compile(r'DEFEAT|LOSE|LOSS', re.IGNORECASE)
+
+
 class MedalType(Enum):
     """Tipos de medalha baseados em cor."""
     GOLD = "GOLD"
@@ -96,6 +121,48 @@ class GameData:
         }
 
 
+@lru_cache(maxsize=1024)
+def _normalize_nickname(name: str) -> str:
+    """Forma normalizada (minúscula, sem espaços nas pontas) usada na busca."""
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=4096)
+def _name_mask(name: str) -> Optional[int]:
+    """
+    Converte um nome ASCII em uma máscara com um bit por caractere distinto.
+
+    Returns:
+        Máscara de 128 bits, ou None se o nome tiver caracteres não-ASCII
+    """
+    if not name.isascii():
+        return None
+    mask = 0
+    for char in name:
+        mask |= 1 << ord(char)
+    return mask
+
+
+def _build_medal_tables(ranges) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monta as tabelas usadas na detecção de medalha.
+
+    Returns:
+        Tupla (LUT 1x256x3 que marca, por canal, o bit de cada medalha cuja
+        faixa contém o valor; matriz medalhas x 8 que soma o histograma de
+        códigos por bit)
+    """
+    values = np.arange(256)
+    lut = np.zeros((1, 256, 3), dtype=np.uint8)
+    for bit, (_, lower, upper) in enumerate(ranges):
+        for channel in range(3):
+            inside = (values >= lower[channel]) & (values <= upper[channel])
+            lut[0, inside, channel] |= 1 << bit
+    codes = np.arange(8)
+    bit_table = np.array([(codes >> bit) & 1 for bit in range(len(ranges))])
+    return lut, bit_table
+
+
 class MLBBExtractor:
     """
     Extrai dados de jogadores de screenshots do MLBB.
@@ -111,6 +178,46 @@ class MLBBExtractor:
         pytesseract: Módulo pytesseract para OCR
     """
 
+    # Configurações do Tesseract por região
+    RESULT_OCR_CONFIG = "--psm 7 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    SCORE_OCR_CONFIG = "--psm 7 -c tessedit_char_whitelist=0123456789"
+    DURATION_OCR_CONFIG = "--psm 7 -c tessedit_char_whitelist=0123456789:"
+    # PSM 6 para suportar múltiplas linhas (tag do clã + nickname)
+    NICKNAME_OCR_CONFIG = "--psm 6"
+    # Leitura rápida (uma linha, sem ampliação) da primeira passada da busca
+    NICKNAME_FAST_OCR_CONFIG = "--psm 7"
+    STATS_OCR_CONFIG = "--psm 6 -c tessedit_char_whitelist=0123456789 "
+    RATIO_OCR_CONFIG = "--psm 8 -c tessedit_char_whitelist=0123456789."
+    
+    # Altura (px) da faixa preta que separa as regiões no OCR em lote
+    OCR_BATCH_SEPARATOR = 20
+    
+    # Número máximo de textos mantidos no cache de OCR em memória
+    OCR_MEMORY_CACHE_SIZE = 1024
+    
+    # Divisão (dígitos de K, dígitos de D) tentada primeiro em K/D/A
+    # concatenado, por tamanho da string
+    KDA_CANONICAL_SPLITS = {6: (2, 2), 3: (1, 1)}
+    
+    # Largura (em múltiplos da de referência) a partir da qual a screenshot é
+    # reduzida com downscale_large_images
+    DOWNSCALE_THRESHOLD = 1.5
+    
+    # Trechos testados, em ordem, num rating lido com 4+ dígitos (o último
+    # dígito do trecho é a casa decimal): meio-2, últimos-2, últimos-3,
+    # primeiros-2, primeiros-3
+    RATING_DIGIT_SLICES = (
+        slice(1, 3), slice(-2, None), slice(-3, None), slice(0, 2), slice(0, 3),
+    )
+
+    # Faixas HSV (inclusivas, como no cv2.inRange) de cada medalha
+    MEDAL_HSV_RANGES = (
+        (MedalType.GOLD, (15, 80, 120), (35, 255, 255)),
+        (MedalType.SILVER, (0, 0, 150), (180, 50, 255)),
+        (MedalType.COPPER, (8, 80, 80), (20, 255, 200)),
+    )
+    _MEDAL_LUT, _MEDAL_BIT_TABLE = _build_medal_tables(MEDAL_HSV_RANGES)
+
     def __init__(
         self, 
         tesseract_cmd: Optional[str] = None,
@@ -135,22 +242,89 @@ class MLBBExtractor:
             pytesseract.pytesseract.tesseract_cmd = self.config.tesseract_cmd
         self.pytesseract = pytesseract
         
+        # O tesserocr usa a biblioteca com que foi compilado, não um
+        # executável: com tesseract_cmd definido, usar o pytesseract
+        if self.config.tesseract_cmd and self.config.use_tesserocr and TESSEROCR_AVAILABLE:
+            print(
+                "Aviso: tesseract_cmd definido; usando pytesseract em vez de "
+                "tesserocr para respeitar o executável configurado"
+            )
+        
+        # APIs persistentes do Tesseract (tesserocr), uma por thread, criadas
+        # sob demanda (a API não é thread-safe)
+        self._tess_local = threading.local()
+        self._tess_apis: List[TesseractAPI] = []
+        self._lock = threading.Lock()
+        
+        # Threads para o OCR dos jogadores (criadas sob demanda)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Coordenadas em pixels por (região, largura, altura): em um lote com
+        # a mesma resolução, cada região é convertida uma única vez
+        self._region_boxes: Dict[Tuple[RegionConfig, int, int], Tuple[int, int, int, int]] = {}
+        
+        # Aquecer o Tesseract (carrega o modelo de idioma antes da 1ª imagem)
+        if not os.environ.get("MLBB_SKIP_WARMUP"):
+            self._warm_up_tesseract()
+        
         # Carregar mapeamentos de nicknames
         self.nickname_mappings = self._load_nickname_mappings()
+        self._nickname_aliases = self._build_nickname_aliases(self.nickname_mappings)
         
-        # Carregar mapeamento de heróis
+        # Carregar mapeamento de heróis (as imagens são carregadas sob demanda)
         self.heroes_map = self._load_heroes_map()
-        self.hero_images = self._load_hero_images()
+        self._hero_images: Optional[Dict[str, Dict[str, Any]]] = None
         
         # Inicializar controle de debug
         self._debug_counter = 0
         self._current_image_name = ""
+        self._debug_writer: Optional[DebugWriter] = None
+        
+        # Resultados de OCR pré-calculados em lote para a imagem atual
+        self._ocr_prefetch: Dict[Tuple[bytes, str], str] = {}
+        
+        # Cache em memória (LRU) dos textos já reconhecidos nesta instância
+        self._ocr_memory: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
+        
+        # Cache em disco de OCR (opcional)
+        self.ocr_cache = DiskCache(self.config.cache_dir) if self.config.cache_dir else None
+        # Salt das chaves do cache de resultado, recalculado quando as opções
+        # que afetam o OCR mudam: (opções, salt)
+        self._result_cache_salt: Optional[Tuple[Tuple[Any, ...], str]] = None
+        # Identificação do mecanismo de OCR por (use_tesserocr, tesseract_cmd)
+        self._ocr_backends: Dict[Tuple[bool, Optional[str]], str] = {}
 
     @property
     def profile(self) -> ResolutionProfile:
         """Retorna o perfil de resolução ativo."""
         return self.config.active_profile
     
+    @property
+    def hero_images(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Imagens de heróis com descriptors ORB.
+        
+        Carregadas no primeiro uso, pois o cálculo das features de todos os
+        heróis é caro e desnecessário quando nenhum jogador é extraído
+        (ex: jogador não encontrado na screenshot).
+        """
+        if self._hero_images is None:
+            self._hero_images = self._load_hero_images()
+        return self._hero_images
+    
+    def _warm_up_tesseract(self) -> None:
+        """
+        Executa um OCR descartável em uma imagem pequena.
+        
+        A primeira chamada ao Tesseract lê o modelo de idioma do disco; fazer
+        isso na inicialização evita que a primeira screenshot seja penalizada.
+        Falhas são ignoradas (o erro real aparece na primeira extração).
+        """
+        try:
+            self._image_to_string(np.zeros((32, 32), dtype=np.uint8), "--psm 7")
+        except Exception:
+            pass
+    
     def _ensure_debug_dir(self) -> None:
         """Cria o diretório de debug se não existir."""
         if self.config.debug_mode:
@@ -188,8 +362,38 @@ class MLBBExtractor:
         filename = "_".join(filename_parts) + ".png"
         filepath = Path(self.config.debug_dir) / filename
         
-        # Salvar imagem
-        cv2.imwrite(str(filepath), image)
+        # Salvar imagem (em segundo plano)
+        if self._debug_writer is None:
+            self._debug_writer = DebugWriter()
+        self._debug_writer.write(filepath, image)
+    
+    def _flush_debug_images(self) -> None:
+        """Aguarda a gravação das imagens de debug pendentes."""
+        if self._debug_writer is not None:
+            self._debug_writer.flush()
+    
+    def close(self) -> None:
+        """
+        Libera os recursos do extrator (grava imagens de debug pendentes e
+        encerra a API do Tesseract).
+        """
+        if self._debug_writer is not None:
+            self._debug_writer.close()
+            self._debug_writer = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._lock:
+            for api in self._tess_apis:
+                api.end()
+            self._tess_apis.clear()
+        self._tess_local = threading.local()
+    
+    def __enter__(self) -> "MLBBExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def _extract_region(
         self, 
@@ -198,9 +402,297 @@ class MLBBExtractor:
     ) -> np.ndarray:
         """Extrai uma região da imagem usando coordenadas percentuais."""
         height, width = image.shape[:2]
-        x, y, w, h = region.to_pixels(width, height)
+        key = (region, width, height)
+        box = self._region_boxes.get(key)
+        if box is None:
+            box = self._region_boxes[key] = region.to_pixels(width, height)
+        x, y, w, h = box
         return image[y:y+h, x:x+w]
 
+    # =========================================================================
+    # OCR
+    # =========================================================================
+
+    @staticmethod
+    def _ocr_key(image: np.ndarray, config: str) -> Tuple[bytes, str]:
+        """Gera a chave de uma imagem processada + configuração do Tesseract."""
+        image = np.ascontiguousarray(image)
+        digest = hashlib.blake2b(image.data, digest_size=16)
+        digest.update(repr(image.shape).encode())
+        return (digest.digest(), config)
+
+    def _get_tess_api(self) -> Optional[TesseractAPI]:
+        """
+        Retorna a API persistente do Tesseract da thread atual, se habilitada
+        e disponível (nunca com ``tesseract_cmd`` definido, que só vale para
+        o pytesseract).
+        """
+        if not (self.config.use_tesserocr and TESSEROCR_AVAILABLE):
+            return None
+        if self.config.tesseract_cmd:
+            return None
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = self._tess_local.api = TesseractAPI()
+            with self._lock:
+                self._tess_apis.append(api)
+        return api
+
+    def _ocr_backend(self) -> str:
+        """
+        Identifica o mecanismo de OCR em uso e sua versão.
+        
+        Faz parte das chaves do cache em disco: trocar de biblioteca ou de
+        executável do Tesseract invalida os textos já reconhecidos.
+        """
+        options = (self.config.use_tesserocr, self.config.tesseract_cmd)
+        backend = self._ocr_backends.get(options)
+        if backend is None:
+            if self._get_tess_api() is not None:
+                backend = f"tesserocr {tesseract_version()}"
+            else:
+                try:
+                    version = str(self.pytesseract.get_tesseract_version())
+                except Exception:
+                    version = "?"
+                cmd = self.pytesseract.pytesseract.tesseract_cmd
+                backend = f"pytesseract {cmd} {version}"
+            backend = self._ocr_backends[options] = " ".join(backend.split())
+        return backend
+
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """
+        Retorna o pool de threads do OCR, ou None se a extração é sequencial.
+        
+        O modo debug é sempre sequencial para manter a numeração das imagens.
+        """
+        if self.config.ocr_threads <= 1 or self.config.debug_mode:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.ocr_threads, thread_name_prefix="mlbb-ocr"
+            )
+        return self._executor
+
+    def _map(self, func: Callable, items: Iterable) -> Iterable:
+        """
+        Aplica ``func`` a cada item, distribuindo entre as threads de OCR.
+        
+        Sem pool de threads, retorna um iterador preguiçoso (cada item só é
+        processado quando consumido).
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return map(func, items)
+        return list(executor.map(func, items))
+
+    def _image_to_string(self, image: np.ndarray, config: str) -> str:
+        """Chama o Tesseract (tesserocr quando disponível, senão pytesseract)."""
+        api = self._get_tess_api()
+        if api is not None:
+            return api.image_to_string(image, config)
+        return self.pytesseract.image_to_string(image, config=config)
+
+    def _image_to_data(self, image: np.ndarray, config: str = "") -> Dict[str, List]:
+        """Como ``_image_to_string``, retornando palavras com posições."""
+        api = self._get_tess_api()
+        if api is not None:
+            return api.image_to_data(image, config)
+        return self.pytesseract.image_to_data(
+            image, config=config, output_type=self.pytesseract.Output.DICT
+        )
+
+    def _ocr(self, image: np.ndarray, config: str) -> str:
+        """
+        Executa OCR em uma imagem processada.
+        
+        Usa o resultado pré-calculado em lote, o cache em memória ou o cache
+        em disco quando disponíveis.
+        """
+        key = self._ocr_key(image, config)
+        cached = self._ocr_prefetch.get(key)
+        if cached:
+            return cached
+        
+        memory = self._ocr_memory
+        with self._lock:
+            text = memory.get(key)
+            if text is not None:
+                memory.move_to_end(key)
+        if text is not None:
+            return text
+        
+        if self.ocr_cache is None:
+            text = self._image_to_string(image, config)
+        else:
+            cache_key = f"{key[0].hex()}|{config}|{self._ocr_backend()}"
+            text = self.ocr_cache.get(cache_key)
+            if text is None:
+                text = self._image_to_string(image, config)
+                self.ocr_cache.set(cache_key, text)
+        
+        with self._lock:
+            memory[key] = text
+            if len(memory) > self.OCR_MEMORY_CACHE_SIZE:
+                memory.popitem(last=False)
+        return text
+
+    def _ocr_batch(self, images: List[np.ndarray], config: str) -> List[str]:
+        """
+        Executa OCR em várias regiões com uma única chamada ao Tesseract.
+        
+        As regiões são empilhadas verticalmente (separadas por faixas pretas)
+        e as palavras retornadas por ``image_to_data`` são redistribuídas
+        para a região de origem pela coordenada vertical.
+        
+        Args:
+            images: Regiões já pré-processadas (mesmo número de canais)
+            config: Configuração do Tesseract (ex: "--psm 6")
+            
+        Returns:
+            Texto de cada região, na mesma ordem de ``images``
+        """
+        if not images:
+            return []
+        
+        separator = self.OCR_BATCH_SEPARATOR
+        max_width = max(img.shape[1] for img in images)
+        
+        padded = []
+        band_starts = []
+        y = 0
+        for img in images:
+            height, width = img.shape[:2]
+            padded.append(cv2.copyMakeBorder(
+                img, 0, separator, 0, max_width - width,
+                cv2.BORDER_CONSTANT, value=0
+            ))
+            band_starts.append(y)
+            y += height + separator
+        
+        # Só regiões vazias (largura zero): não há o que ler
+        if max_width == 0:
+            return [""] * len(images)
+        
+        stack = np.vstack(padded)
+        data = self._image_to_data(stack, config)
+        
+        # Agrupar palavras por região e por linha (block, par, line)
+        lines: List[Dict[Tuple[int, int, int], List[str]]] = [{} for _ in images]
+        for i, word in enumerate(data['text']):
+            word = word.strip()
+            if not word:
+                continue
+            center = data['top'][i] + data['height'][i] // 2
+            idx = int(np.searchsorted(band_starts, center, side='right')) - 1
+            idx = min(max(idx, 0), len(images) - 1)
+            line_key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines[idx].setdefault(line_key, []).append(word)
+        
+        return ["\n".join(" ".join(words) for words in region_lines.values())
+                for region_lines in lines]
+
+    def _prefetch_ocr(self, jobs: List[Tuple[np.ndarray, str]]) -> None:
+        """
+        Pré-calcula o OCR de várias regiões agrupando-as por configuração.
+        
+        Regiões com a mesma whitelist são lidas juntas em modo PSM 6 (bloco
+        com várias linhas), independente do PSM usado individualmente. Os
+        textos não vazios ficam disponíveis para ``_ocr`` até a próxima
+        imagem; as demais regiões são lidas individualmente.
+        
+        Args:
+            jobs: Lista de (imagem processada, configuração do Tesseract)
+        """
+        by_config: Dict[str, List[Tuple[np.ndarray, str]]] = {}
+        for image, config in jobs:
+            batch_config = _PSM_RE.sub('--psm 6', config)
+            by_config.setdefault(batch_config, []).append((image, config))
+        
+        for batch_config, group in by_config.items():
+            images = [image for image, _ in group]
+            texts = self._ocr_batch(images, batch_config)
+            for (image, config), text in zip(group, texts):
+                # Região sem palavras na leitura em bloco (PSM 6): fica para
+                # o OCR individual, com o PSM próprio da região
+                if text:
+                    self._ocr_prefetch[self._ocr_key(image, config)] = text
+
+    def _downscale_to_profile(self, image: np.ndarray) -> np.ndarray:
+        """
+        Reduz screenshots muito maiores que a resolução de referência do perfil.
+        
+        Só atua com ``downscale_large_images`` ativo e quando a largura passa
+        de ``DOWNSCALE_THRESHOLD`` vezes a de referência; as regiões são
+        percentuais, então continuam valendo na imagem reduzida.
+        """
+        if not self.config.downscale_large_images:
+            return image
+        profile = self.profile
+        if image.shape[1] <= profile.reference_width * self.DOWNSCALE_THRESHOLD:
+            return image
+        return cv2.resize(
+            image, (profile.reference_width, profile.reference_height),
+            interpolation=cv2.INTER_AREA
+        )
+
+    def _collect_ocr_jobs(
+        self, 
+        image: np.ndarray, 
+        include_match_info: bool = True
+    ) -> List[Tuple[np.ndarray, str]]:
+        """
+        Monta as regiões processadas lidas na primeira tentativa de OCR.
+        
+        Usa o mesmo pré-processamento dos métodos ``extract_*``, para que o
+        resultado em lote seja encontrado por ``_ocr``.
+        
+        Args:
+            image: Imagem completa do screenshot
+            include_match_info: Se False, omite as regiões da partida
+            
+        Returns:
+            Lista de (imagem processada, configuração do Tesseract)
+        """
+        profile = self.profile
+        preprocessor = self.preprocessor
+        
+        jobs: List[Tuple[np.ndarray, str]] = []
+        if include_match_info:
+            jobs.extend([
+                (preprocessor.preprocess_threshold(
+                    self._extract_region(image, profile.result_region), 4),
+                 self.RESULT_OCR_CONFIG),
+                (preprocessor.preprocess_grayscale_scaled(
+                    self._extract_region(image, profile.my_team_score_region), 3),
+                 self.SCORE_OCR_CONFIG),
+                (preprocessor.preprocess_grayscale_scaled(
+                    self._extract_region(image, profile.adversary_score_region), 3),
+                 self.SCORE_OCR_CONFIG),
+                (preprocessor.preprocess_grayscale_scaled(
+                    self._extract_region(image, profile.duration_region), 2),
+                 self.DURATION_OCR_CONFIG),
+            ])
+        
+        for player_config in profile.players:
+            jobs.append((
+                preprocessor.preprocess_grayscale_scaled(
+                    self._extract_region(image, player_config.nickname), 2),
+                self.NICKNAME_OCR_CONFIG,
+            ))
+            jobs.append((
+                preprocessor.preprocess_grayscale_scaled(
+                    self._extract_region(image, player_config.stats), 3),
+                self.STATS_OCR_CONFIG,
+            ))
+            jobs.append((
+                preprocessor.preprocess_threshold(
+                    self._extract_region(image, player_config.ratio), 4),
+                self.RATIO_OCR_CONFIG,
+            ))
+        
+        return jobs
+
     # =========================================================================
     # EXTRAÇÃO DE INFORMAÇÕES DA PARTIDA
     # =========================================================================
@@ -216,46 +708,38 @@ class MLBBExtractor:
             MatchInfo com dados da partida
         """
         profile = self.profile
+        preprocessor = self.preprocessor
+        
+        # Regiões da partida: (nome, região, pré-processamento, escala, config)
+        jobs = [
+            # Resultado (VICTORY/DEFEAT)
+            ("result", profile.result_region,
+             preprocessor.preprocess_threshold, 4, self.RESULT_OCR_CONFIG),
+            # Placar do meu time
+            ("my_team_score", profile.my_team_score_region,
+             preprocessor.preprocess_grayscale_scaled, 3, self.SCORE_OCR_CONFIG),
+            # Placar adversário
+            ("adversary_score", profile.adversary_score_region,
+             preprocessor.preprocess_grayscale_scaled, 3, self.SCORE_OCR_CONFIG),
+            # Duração
+            ("duration", profile.duration_region,
+             preprocessor.preprocess_grayscale_scaled, 2, self.DURATION_OCR_CONFIG),
+        ]
         
-        # Extrair resultado (VICTORY/DEFEAT)
-        result_region = self._extract_region(image, profile.result_region)
-        self._save_debug_image(result_region, "result", "raw")
-        processed = self.preprocessor.preprocess_threshold(result_region, 4)
-        self._save_debug_image(processed, "result", "processed")
-        result_text = self.pytesseract.image_to_string(
-            processed, 
-            config="--psm 7 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        ).strip()
+        def read(job) -> str:
+            name, region_config, preprocess, scale, config = job
+            region = self._extract_region(image, region_config)
+            self._save_debug_image(region, name, "raw")
+            processed = preprocess(region, scale)
+            self._save_debug_image(processed, name, "processed")
+            return self._ocr(processed, config).strip()
+        
+        # As quatro regiões são independentes: com ocr_threads > 1 são lidas
+        # em paralelo
+        result_text, my_score_text, adv_score_text, duration_text = self._map(read, jobs)
         result = self._parse_result(result_text)
-        
-        # Extrair placar do meu time
-        my_score_region = self._extract_region(image, profile.my_team_score_region)
-        self._save_debug_image(my_score_region, "my_team_score", "raw")
-        processed = self.preprocessor.preprocess_grayscale_scaled(my_score_region, 3)
-        self._save_debug_image(processed, "my_team_score", "processed")
-        my_score_text = self.pytesseract.image_to_string(
-            processed, config="--psm 7 -c tessedit_char_whitelist=0123456789"
-        ).strip()
         my_score = self._parse_number(my_score_text, 0)
-        
-        # Extrair placar adversário
-        adv_score_region = self._extract_region(image, profile.adversary_score_region)
-        self._save_debug_image(adv_score_region, "adversary_score", "raw")
-        processed = self.preprocessor.preprocess_grayscale_scaled(adv_score_region, 3)
-        self._save_debug_image(processed, "adversary_score", "processed")
-        adv_score_text = self.pytesseract.image_to_string(
-            processed, config="--psm 7 -c tessedit_char_whitelist=0123456789"
-        ).strip()
         adv_score = self._parse_number(adv_score_text, 0)
-        
-        # Extrair duração
-        duration_region = self._extract_region(image, profile.duration_region)
-        self._save_debug_image(duration_region, "duration", "raw")
-        processed = self.preprocessor.preprocess_grayscale_scaled(duration_region, 2)
-        self._save_debug_image(processed, "duration", "processed")
-        duration_text = self.pytesseract.image_to_string(
-            processed, config="--psm 7 -c tessedit_char_whitelist=0123456789:"
-        ).strip()
         duration = self._parse_duration(duration_text)
         
         return MatchInfo(
@@ -265,6 +749,17 @@ class MLBBExtractor:
             duration=duration
         )
 
+    def _match_info_or_unknown(self, image: np.ndarray, include: bool) -> MatchInfo:
+        """
+        Extrai as informações da partida, ou retorna valores neutros sem
+        executar OCR quando ``include`` é False.
+        """
+        if include:
+            return self.extract_match_info(image)
+        return MatchInfo(
+            result="UNKNOWN", my_team_score=0, adversary_team_score=0, duration="00:00"
+        )
+
     # =========================================================================
     # EXTRAÇÃO DE DADOS DO JOGADOR
     # =========================================================================
@@ -279,12 +774,29 @@ class MLBBExtractor:
         self._save_debug_image(nickname_region, "nickname", "raw")
         processed = self.preprocessor.preprocess_grayscale_scaled(nickname_region, 2)
         self._save_debug_image(processed, "nickname", "processed")
-        # PSM 6 para suportar múltiplas linhas (tag do clã + nickname)
-        nickname = self.pytesseract.image_to_string(processed, config="--psm 6").strip()
+        nickname = self._ocr(processed, self.NICKNAME_OCR_CONFIG).strip()
         nickname = self._clean_nickname(nickname)
         # Aplicar mapeamento se existir
         return self._apply_nickname_mapping(nickname)
 
+    def _extract_player_nickname_fast(
+        self, 
+        image: np.ndarray, 
+        player_config: PlayerRegionConfig
+    ) -> str:
+        """
+        Lê o nickname sem ampliar a região e como uma única linha.
+        
+        Mais barato que ``extract_player_nickname``, porém menos preciso
+        (a tag do clã em outra linha pode ser perdida).
+        """
+        nickname_region = self._extract_region(image, player_config.nickname)
+        processed = self.preprocessor.preprocess_grayscale_scaled(nickname_region, 1)
+        self._save_debug_image(processed, "nickname", "processed_fast")
+        nickname = self._ocr(processed, self.NICKNAME_FAST_OCR_CONFIG).strip()
+        nickname = self._clean_nickname(nickname)
+        return self._apply_nickname_mapping(nickname)
+
     def extract_player_stats(
         self, 
         image: np.ndarray, 
@@ -300,37 +812,33 @@ class MLBBExtractor:
         """
         stats_region = self._extract_region(image, player_config.stats)
         self._save_debug_image(stats_region, "stats", "raw")
+        # Tons de cinza calculados uma vez para todas as estratégias
+        stats_gray = self.preprocessor.convert_to_grayscale(stats_region)
         
         # Estratégia 1: PSM 6 (bloco uniforme) que às vezes preserva espaços
-        processed = self.preprocessor.preprocess_grayscale_scaled(stats_region, 3)
+        processed = self.preprocessor.preprocess_grayscale_scaled(stats_gray, 3)
         self._save_debug_image(processed, "stats", "processed_gray")
-        text1 = self.pytesseract.image_to_string(
-            processed, 
-            config="--psm 6 -c tessedit_char_whitelist=0123456789 "
-        ).strip()
+        text1 = self._ocr(processed, self.STATS_OCR_CONFIG).strip()
         
-        numbers = re.findall(r'\d+', text1)
+        numbers = _DIGITS_RE.findall(text1)
         if len(numbers) >= 4:
             return (int(numbers[0]), int(numbers[1]), int(numbers[2]), int(numbers[3]))
         
         # Estratégia 2: Tentar com pré-processamento diferente (invertido)
-        inverted = self.preprocessor.preprocess_inverted(stats_region, 3)
+        inverted = self.preprocessor.preprocess_inverted(stats_gray, 3)
         self._save_debug_image(inverted, "stats", "processed_inverted")
-        text2 = self.pytesseract.image_to_string(
-            inverted, 
-            config="--psm 6 -c tessedit_char_whitelist=0123456789 "
-        ).strip()
+        text2 = self._ocr(inverted, self.STATS_OCR_CONFIG).strip()
         
-        numbers = re.findall(r'\d+', text2)
+        numbers = _DIGITS_RE.findall(text2)
         if len(numbers) >= 4:
             return (int(numbers[0]), int(numbers[1]), int(numbers[2]), int(numbers[3]))
         
         # Estratégia 3: Usar image_to_data para obter bounding boxes das palavras
-        data = self.pytesseract.image_to_data(processed, output_type=self.pytesseract.Output.DICT)
+        data = self._image_to_data(processed)
         words = [w for w in data['text'] if w.strip()]
         word_numbers = []
         for w in words:
-            digits = ''.join(filter(str.isdigit, w))
+            digits = _NON_DIGIT_RE.sub('', w)
             if digits:
                 word_numbers.append(int(digits))
         
@@ -339,7 +847,7 @@ class MLBBExtractor:
         
         # Estratégia 4: Parse inteligente de string concatenada
         best_text = text1 if text1 else text2
-        all_digits = ''.join(filter(str.isdigit, best_text))
+        all_digits = _NON_DIGIT_RE.sub('', best_text)
         
         if len(all_digits) >= 7:
             return self._parse_concatenated_stats_smart(all_digits)
@@ -361,7 +869,9 @@ class MLBBExtractor:
         
         return (0, 0, 0, 0)
 
-    def _parse_concatenated_stats_smart(self, digits: str) -> Tuple[int, int, int, int]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_concatenated_stats_smart(digits: str) -> Tuple[int, int, int, int]:
         """
         Parse inteligente de stats concatenados sabendo que ouro tem 4-5 dígitos.
         
@@ -387,7 +897,7 @@ class MLBBExtractor:
             if not (3000 <= gold <= 40000):
                 continue
             
-            kda = self._parse_kda_all_combinations(kda_str)
+            kda = MLBBExtractor._parse_kda_all_combinations(kda_str)
             
             if kda:
                 score = 10 if (8000 <= gold <= 30000) else 5
@@ -398,13 +908,26 @@ class MLBBExtractor:
         
         return best_result
 
-    def _parse_kda_all_combinations(self, kda_str: str) -> Optional[Tuple[int, int, int]]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_kda_all_combinations(kda_str: str) -> Optional[Tuple[int, int, int]]:
         """Tenta todas as combinações válidas de K/D/A e retorna a mais razoável."""
         length = len(kda_str)
         
         if length < 3:
             return None
         
+        # Splits canônicos (KK DD AA e K D A): quando válidos, sempre vencem a
+        # pontuação abaixo, então não é preciso avaliar as outras divisões
+        canonical = MLBBExtractor.KDA_CANONICAL_SPLITS.get(length)
+        if canonical:
+            k_len, d_len = canonical
+            k = int(kda_str[:k_len])
+            d = int(kda_str[k_len:k_len+d_len])
+            a = int(kda_str[k_len+d_len:])
+            if d < k + a and k <= 50 and d <= 30 and a <= 50:
+                return (k, d, a)
+        
         valid_parses = []
         
         for k_len in range(1, min(3, length-1)):
@@ -413,46 +936,42 @@ class MLBBExtractor:
                 if not (1 <= a_len <= 3):
                     continue
                 
-                try:
-                    k = int(kda_str[:k_len])
-                    d = int(kda_str[k_len:k_len+d_len])
-                    a = int(kda_str[k_len+d_len:])
+                k = int(kda_str[:k_len])
+                d = int(kda_str[k_len:k_len+d_len])
+                a = int(kda_str[k_len+d_len:])
+                
+                if 0 <= k <= 50 and 0 <= d <= 30 and 0 <= a <= 50:
+                    score = 0
                     
-                    if 0 <= k <= 50 and 0 <= d <= 30 and 0 <= a <= 50:
-                        score = 0
-                        
-                        if d < k + a:
-                            score += 10
-                        
-                        if k > 0 and a > 0:
-                            ratio = max(k, a) / min(k, a)
-                            if ratio < 10:
-                                score += 5
-                            if ratio < 5:
-                                score += 3
-                        
-                        digit_variance = abs(k_len - d_len) + abs(d_len - a_len)
-                        score += max(0, 5 - digit_variance * 2)
-                        
-                        if length == 6 and k_len == d_len == a_len == 2:
-                            score += 5
-                        
-                        if length == 5 and k_len == 2 and d_len == 2 and a_len == 1:
+                    if d < k + a:
+                        score += 10
+                    
+                    if k > 0 and a > 0:
+                        ratio = max(k, a) / min(k, a)
+                        if ratio < 10:
                             score += 5
-                        
-                        if d_len == 1 and d <= 1 and (k >= 10 or a >= 10):
-                            score -= 5
-                        
-                        if 5 <= d <= 15:
+                        if ratio < 5:
                             score += 3
-                        
-                        valid_parses.append((score, k, d, a))
-                except ValueError:
-                    continue
+                    
+                    digit_variance = abs(k_len - d_len) + abs(d_len - a_len)
+                    score += max(0, 5 - digit_variance * 2)
+                    
+                    if length == 6 and k_len == d_len == a_len == 2:
+                        score += 5
+                    
+                    if length == 5 and k_len == 2 and d_len == 2 and a_len == 1:
+                        score += 5
+                    
+                    if d_len == 1 and d <= 1 and (k >= 10 or a >= 10):
+                        score -= 5
+                    
+                    if 5 <= d <= 15:
+                        score += 3
+                    
+                    valid_parses.append((score, k, d, a))
         
         if valid_parses:
-            valid_parses.sort(reverse=True)
-            _, k, d, a = valid_parses[0]
+            _, k, d, a = max(valid_parses)
             return (k, d, a)
         
         return None
@@ -470,14 +989,16 @@ class MLBBExtractor:
         """
         ratio_region = self._extract_region(image, player_config.ratio)
         self._save_debug_image(ratio_region, "ratio", "raw")
+        # Tons de cinza calculados uma vez para todas as estratégias
+        ratio_gray = self.preprocessor.convert_to_grayscale(ratio_region)
         
-        tesseract_config = "--psm 8 -c tessedit_char_whitelist=0123456789."
+        tesseract_config = self.RATIO_OCR_CONFIG
         
         # Estratégia 1: threshold com inversão de cores
         # Ideal para texto branco em fundo azul
-        threshold_processed = self.preprocessor.preprocess_threshold(ratio_region, 4)
+        threshold_processed = self.preprocessor.preprocess_threshold(ratio_gray, 4)
         self._save_debug_image(threshold_processed, "ratio", "threshold")
-        ratio_text = self.pytesseract.image_to_string(threshold_processed, config=tesseract_config).strip()
+        ratio_text = self._ocr(threshold_processed, tesseract_config).strip()
         
         if self.config.debug_mode:
             print(f"  → Rating OCR (threshold): '{ratio_text}'")
@@ -490,9 +1011,9 @@ class MLBBExtractor:
             return result
         
         # Estratégia 2 (fallback): grayscale scaled
-        processed = self.preprocessor.preprocess_grayscale_scaled(ratio_region, 6)
+        processed = self.preprocessor.preprocess_grayscale_scaled(ratio_gray, 6)
         self._save_debug_image(processed, "ratio", "grayscale")
-        ratio_text = self.pytesseract.image_to_string(processed, config=tesseract_config).strip()
+        ratio_text = self._ocr(processed, tesseract_config).strip()
         
         if self.config.debug_mode:
             print(f"  → Rating OCR (grayscale): '{ratio_text}'")
@@ -551,9 +1072,8 @@ class MLBBExtractor:
         # Estratégia 1: OCR com threshold (texto dourado em faixa vermelha)
         threshold_processed = self.preprocessor.preprocess_threshold(medal_region, 3)
         self._save_debug_image(threshold_processed, "mvp", "threshold")
-        mvp_text = self.pytesseract.image_to_string(
-            threshold_processed,
-            config="--psm 8 -c tessedit_char_whitelist=MVP"
+        mvp_text = self._ocr(
+            threshold_processed, "--psm 8 -c tessedit_char_whitelist=MVP"
         ).strip().upper()
         
         if self.config.debug_mode:
@@ -599,23 +1119,11 @@ class MLBBExtractor:
         
         hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
         
-        # Ranges de cor
-        gold_lower = np.array([15, 80, 120])
-        gold_upper = np.array([35, 255, 255])
-        
-        silver_lower = np.array([0, 0, 150])
-        silver_upper = np.array([180, 50, 255])
-        
-        copper_lower = np.array([8, 80, 80])
-        copper_upper = np.array([20, 255, 200])
-        
-        gold_mask = cv2.inRange(hsv, gold_lower, gold_upper)
-        silver_mask = cv2.inRange(hsv, silver_lower, silver_upper)
-        copper_mask = cv2.inRange(hsv, copper_lower, copper_upper)
-        
-        gold_pixels = cv2.countNonZero(gold_mask)
-        silver_pixels = cv2.countNonZero(silver_mask)
-        copper_pixels = cv2.countNonZero(copper_mask)
+        # Cada canal vira um código de bits (um bit por medalha); o AND dos
+        # três canais diz em quais faixas o pixel cai, tudo em uma passada
+        codes = np.bitwise_and.reduce(cv2.LUT(hsv, self._MEDAL_LUT), axis=2)
+        counts = self._MEDAL_BIT_TABLE @ np.bincount(codes.ravel(), minlength=8)
+        gold_pixels, silver_pixels, copper_pixels = (int(c) for c in counts)
         
         max_pixels = max(gold_pixels, silver_pixels, copper_pixels)
         
@@ -651,21 +1159,35 @@ class MLBBExtractor:
         Returns:
             Posição do jogador (0-4) ou None se não encontrado
         """
-        target_lower = target_nickname.lower().strip()
-        
-        # Criar lista de targets possíveis (incluindo mapeamentos)
-        possible_targets = [target_lower]
-        
-        # Adicionar mapeamentos reversos (se target é o nickname mapeado, buscar pelo original)
-        for original, mapped in self.nickname_mappings.items():
-            if mapped.lower().strip() == target_lower:
-                possible_targets.append(original.lower().strip())
-            elif original.lower().strip() == target_lower:
-                possible_targets.append(mapped.lower().strip())
-        
-        for idx, player_config in enumerate(self.profile.players):
-            nickname = self.extract_player_nickname(image, player_config)
-            nickname_lower = nickname.lower().strip()
+        target_lower = _normalize_nickname(target_nickname)
+        
+        # Targets possíveis: o próprio nickname e seus mapeamentos nos dois
+        # sentidos (se target é o nickname mapeado, buscar pelo original)
+        possible_targets = self._nickname_aliases.get(target_lower, (target_lower,))
+        
+        # Primeira passada opcional com OCR rápido: só aceita match por
+        # substring, que é confiável mesmo numa leitura de baixa resolução
+        if self.config.fast_nickname_search:
+            fast_nicknames = self._map(
+                lambda player_config: self._extract_player_nickname_fast(image, player_config),
+                self.profile.players,
+            )
+            for idx, nickname in enumerate(fast_nicknames):
+                nickname_lower = _normalize_nickname(nickname)
+                if not nickname_lower:
+                    continue
+                for target in possible_targets:
+                    if target in nickname_lower or nickname_lower in target:
+                        return idx
+        
+        # Com threads, os 5 nicknames são lidos em paralelo; sem elas, um a um
+        # até encontrar o jogador
+        nicknames = self._map(
+            lambda player_config: self.extract_player_nickname(image, player_config),
+            self.profile.players,
+        )
+        for idx, nickname in enumerate(nicknames):
+            nickname_lower = _normalize_nickname(nickname)
             
             # Match exato ou parcial com qualquer target possível
             for target in possible_targets:
@@ -683,9 +1205,16 @@ class MLBBExtractor:
         if not name1 or not name2:
             return False
         
-        set1, set2 = set(name1), set(name2)
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        # Nomes ASCII viram máscaras de bits (um bit por caractere) e a
+        # similaridade de Jaccard sai de dois popcounts, sem criar sets
+        mask1, mask2 = _name_mask(name1), _name_mask(name2)
+        if mask1 is not None and mask2 is not None:
+            intersection = (mask1 & mask2).bit_count()
+            union = (mask1 | mask2).bit_count()
+        else:
+            set1, set2 = set(name1), set(name2)
+            intersection = len(set1 & set2)
+            union = len(set1 | set2)
         
         if union == 0:
             return False
@@ -736,7 +1265,9 @@ class MLBBExtractor:
     def extract_game_data(
         self, 
         image_path: str, 
-        player_nickname: str
+        player_nickname: str,
+        image: Optional[np.ndarray] = None,
+        include_match_info: bool = True
     ) -> Optional[GameData]:
         """
         Extrai dados completos do jogo para um jogador específico.
@@ -747,6 +1278,9 @@ class MLBBExtractor:
         Args:
             image_path: Caminho para a imagem do screenshot
             player_nickname: Nickname do jogador a ser buscado
+            image: Imagem já carregada de ``image_path`` (opcional)
+            include_match_info: Se False, não lê resultado, placar e duração
+                (preenchidos com "UNKNOWN", 0, 0 e "00:00")
             
         Returns:
             GameData com todos os dados ou None se jogador não encontrado
@@ -754,26 +1288,36 @@ class MLBBExtractor:
         # Configurar nome da imagem para debug
         self._current_image_name = Path(image_path).stem
         self._debug_counter = 0
+        self._ocr_prefetch.clear()
         
         # Carregar imagem
-        image = self.preprocessor.load_image(image_path)
+        if image is None:
+            image = self.preprocessor.load_image(image_path)
         
         # Auto-selecionar perfil baseado na resolução da imagem
         height, width = image.shape[:2]
         self.config.auto_select_profile(width, height)
+        image = self._downscale_to_profile(image)
+        
+        # OCR em lote: os 5 nicknames da busca (e as demais regiões) são
+        # lidos em uma única chamada por whitelist
+        if self.config.batch_ocr:
+            self._prefetch_ocr(self._collect_ocr_jobs(image, include_match_info))
         
         # Encontrar posição do jogador
         player_index = self.find_player_by_nickname(image, player_nickname)
         
         if player_index is None:
             print(f"Jogador '{player_nickname}' não encontrado no screenshot")
+            self._flush_debug_images()
             return None
         
         # Extrair informações da partida
-        match_info = self.extract_match_info(image)
+        match_info = self._match_info_or_unknown(image, include_match_info)
         
         # Extrair dados do jogador
         player_stats = self.extract_player_data(image, player_index)
+        self._flush_debug_images()
         
         return GameData(
             nickname=player_stats.nickname,
@@ -793,13 +1337,18 @@ class MLBBExtractor:
 
     def extract_all_players(
         self, 
-        image_path: str
+        image_path: str,
+        image: Optional[np.ndarray] = None,
+        include_match_info: bool = True
     ) -> Dict[str, Any]:
         """
         Extrai dados de todos os 5 jogadores do time aliado.
         
         Args:
             image_path: Caminho para a imagem do screenshot
+            image: Imagem já carregada de ``image_path`` (opcional)
+            include_match_info: Se False, não lê resultado, placar e duração
+                (preenchidos com "UNKNOWN", 0, 0 e "00:00")
             
         Returns:
             Dicionário com informações da partida e dados dos jogadores:
@@ -815,18 +1364,43 @@ class MLBBExtractor:
         # Configurar nome da imagem para debug
         self._current_image_name = Path(image_path).stem
         self._debug_counter = 0
+        self._ocr_prefetch.clear()
         
-        image = self.preprocessor.load_image(image_path)
+        if image is None:
+            image = self.preprocessor.load_image(image_path)
         
         # Auto-selecionar perfil
         height, width = image.shape[:2]
         self.config.auto_select_profile(width, height)
-        
-        match_info = self.extract_match_info(image)
+        image = self._downscale_to_profile(image)
+        
+        # Screenshot já processada (cache em disco): dispensa toda a extração.
+        # No modo debug o cache é ignorado para que as imagens sejam geradas
+        result_key = None
+        if self.ocr_cache is not None and not self.config.debug_mode:
+            result_key = self._result_cache_key(image)
+            if not include_match_info:
+                result_key += "|no_match_info"
+            cached = self.ocr_cache.get(result_key)
+            if cached is not None:
+                return json.loads(cached)
+        
+        # OCR em lote: uma chamada ao Tesseract por whitelist, cobrindo a
+        # primeira tentativa de todas as regiões da screenshot
+        if self.config.batch_ocr:
+            self._prefetch_ocr(self._collect_ocr_jobs(image, include_match_info))
+        
+        match_info = self._match_info_or_unknown(image, include_match_info)
+        
+        # Os jogadores são independentes: com ocr_threads > 1 são extraídos
+        # em paralelo (o Tesseract libera o GIL). Os templates de heróis são
+        # carregados antes, para não serem carregados por várias threads
+        if self._get_executor() is not None:
+            self.hero_images
+        players = self._map(lambda idx: self.extract_player_data(image, idx), range(5))
         
         my_team = []
-        for idx in range(5):
-            player_stats = self.extract_player_data(image, idx)
+        for player_stats in players:
             player_data = {
                 "nickname": player_stats.nickname,
                 "kills": player_stats.kills,
@@ -841,7 +1415,9 @@ class MLBBExtractor:
             }
             my_team.append(player_data)
         
-        return {
+        self._flush_debug_images()
+        
+        results = {
             "result": match_info.result,
             "my_team_score": match_info.my_team_score,
             "adversary_team_score": match_info.adversary_team_score,
@@ -849,6 +1425,42 @@ class MLBBExtractor:
             "my_team": my_team,
             "enemy_team": []
         }
+        if result_key is not None:
+            self.ocr_cache.set(result_key, json.dumps(results, ensure_ascii=False))
+        return results
+
+    def _result_cache_key(self, image: np.ndarray) -> str:
+        """
+        Chave do cache de resultado completo de uma screenshot.
+        
+        Combina o hash dos pixels com o perfil ativo e um hash dos perfis,
+        mapeamentos, opções de OCR e mecanismo de OCR, para que alterar
+        qualquer um deles invalide as entradas.
+        """
+        config = self.config
+        options = (
+            config.batch_ocr, config.use_tesserocr, config.tesseract_cmd,
+            config.fast_nickname_search, config.downscale_large_images,
+            config.profiles.version,
+        )
+        if self._result_cache_salt is None or self._result_cache_salt[0] != options:
+            settings = {
+                "profiles": [p.to_dict() for p in config.profiles.values()],
+                "nickname_mappings": self.nickname_mappings,
+                "heroes_map": self.heroes_map,
+                "batch_ocr": config.batch_ocr,
+                "use_tesserocr": config.use_tesserocr,
+                "tesseract_cmd": config.tesseract_cmd,
+                "fast_nickname_search": config.fast_nickname_search,
+                "downscale_large_images": config.downscale_large_images,
+                "ocr_backend": self._ocr_backend(),
+            }
+            salt = hashlib.blake2b(
+                json.dumps(settings, sort_keys=True).encode("utf-8"), digest_size=8
+            ).hexdigest()
+            self._result_cache_salt = (options, salt)
+        digest, _ = self._ocr_key(image, "")
+        return f"all_players|{digest.hex()}|{config.active_profile_name}|{self._result_cache_salt[1]}"
 
     # =========================================================================
     # MÉTODOS AUXILIARES DE PARSING
@@ -856,23 +1468,23 @@ class MLBBExtractor:
 
     def _parse_result(self, text: str) -> str:
         """Parse resultado do jogo a partir de texto."""
-        text_upper = text.upper()
-        if "VICTORY" in text_upper or "VICTOR" in text_upper or "WIN" in text_upper:
+        # Vitória tem prioridade quando as duas palavras aparecem
+        if _VICTORY_RE.search(text):
             return "VICTORY"
-        elif "DEFEAT" in text_upper or "LOSE" in text_upper or "LOSS" in text_upper:
+        elif _DEFEAT_RE.search(text):
             return "DEFEAT"
         return "UNKNOWN"
 
     def _parse_number(self, text: str, default: int = 0) -> int:
         """Parse inteiro de texto."""
-        numbers = re.findall(r'\d+', text)
+        numbers = _DIGITS_RE.findall(text)
         if numbers:
             return int(numbers[0])
         return default
 
     def _parse_float(self, text: str, default: float = 0.0) -> float:
         """Parse float de texto."""
-        match = re.search(r'(\d+\.?\d*|\.\d+)', text)
+        match = _FLOAT_RE.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -902,7 +1514,7 @@ class MLBBExtractor:
             return default
         
         # Extrair apenas dígitos
-        digits = re.sub(r'[^0-9]', '', text)
+        digits = _NON_DIGIT_RE.sub('', text)
         
         if not digits:
             return default
@@ -910,7 +1522,7 @@ class MLBBExtractor:
         # Estratégia 1: Se tem ponto no texto, tentar interpretar diretamente
         if '.' in text:
             try:
-                clean_text = re.sub(r'[^0-9.]', '', text)
+                clean_text = _NON_NUMDOT_RE.sub('', text)
                 parts = clean_text.split('.')
                 
                 if len(parts) == 2:
@@ -929,57 +1541,26 @@ class MLBBExtractor:
                 pass
         
         # Estratégia 2: Interpretar apenas os dígitos (sem ponto)
-        # Último dígito é decimal, resto é inteiro
+        # Último dígito é decimal, resto é inteiro. int / 10 dá exatamente o
+        # mesmo float que float("X.Y"), sem montar strings
         if len(digits) == 1:
             # 1 dígito: X.0
-            value = float(f"{digits}.0")
+            value = float(int(digits))
         elif len(digits) == 2:
             # 2 dígitos: X.Y
-            value = float(f"{digits[0]}.{digits[1]}")
+            value = int(digits) / 10
         elif len(digits) == 3:
             # 3 dígitos: pode ser XX.Y ou X.YZ
             # Tentar XX.Y primeiro (ex: 115 -> 11.5, 757 -> 75.7 inválido)
-            value = float(f"{digits[0:2]}.{digits[2]}")
+            value = int(digits) / 10
             if not (3.0 <= value <= 20.0):
                 # Se não funcionou, tentar X.Y com primeiros 2 dígitos (ex: 877 -> 8.7, 757 -> 7.5)
-                value = float(f"{digits[0]}.{digits[1]}")
+                value = int(digits[:2]) / 10
         else:
             # 4+ dígitos: tentar várias combinações
             # Ex: '5617' -> tentar dígitos centrais primeiro (mais confiáveis)
-            # Ordem: meio-2, meio-3, últimos-2, últimos-3, primeiros-2, primeiros-3
-            
-            # Tentar dígitos do meio (posições 1 e 2 em '5617' -> '61')
-            if len(digits) >= 3:
-                middle_two = digits[1:3]
-                value = float(f"{middle_two[0]}.{middle_two[1]}")
-                if 3.0 <= value <= 20.0:
-                    return value
-            
-            # Tentar últimos 2: X.Y
-            if len(digits) >= 2:
-                last_two = digits[-2:]
-                value = float(f"{last_two[0]}.{last_two[1]}")
-                if 3.0 <= value <= 20.0:
-                    return value
-            
-            # Tentar últimos 3: XX.Y
-            if len(digits) >= 3:
-                last_three = digits[-3:]
-                value = float(f"{last_three[0:2]}.{last_three[2]}")
-                if 3.0 <= value <= 20.0:
-                    return value
-            
-            # Tentar primeiros 2: X.Y
-            if len(digits) >= 2:
-                first_two = digits[0:2]
-                value = float(f"{first_two[0]}.{first_two[1]}")
-                if 3.0 <= value <= 20.0:
-                    return value
-            
-            # Tentar primeiros 3: XX.Y
-            if len(digits) >= 3:
-                first_three = digits[0:3]
-                value = float(f"{first_three[0:2]}.{first_three[2]}")
+            for digit_slice in self.RATING_DIGIT_SLICES:
+                value = int(digits[digit_slice]) / 10
                 if 3.0 <= value <= 20.0:
                     return value
             
@@ -994,11 +1575,11 @@ class MLBBExtractor:
 
     def _parse_duration(self, text: str) -> str:
         """Parse duração no formato mm:ss."""
-        match = re.search(r'(\d{1,2}):(\d{2})', text)
+        match = _DURATION_RE.search(text)
         if match:
             return f"{match.group(1)}:{match.group(2)}"
         
-        numbers = re.findall(r'\d+', text)
+        numbers = _DIGITS_RE.findall(text)
         if len(numbers) >= 2:
             return f"{numbers[0]}:{numbers[1].zfill(2)}"
         
@@ -1013,11 +1594,33 @@ class MLBBExtractor:
         try:
             with open(mappings_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return data.get("mappings", {})
+            # Strings internadas: as chaves são consultadas a cada nickname lido
+            return {
+                sys.intern(original): sys.intern(mapped)
+                for original, mapped in data.get("mappings", {}).items()
+            }
         except Exception as e:
             print(f"Aviso: Erro ao carregar mapeamentos de nicknames: {e}")
             return {}
     
+    @staticmethod
+    def _build_nickname_aliases(mappings: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Monta o índice de nicknames equivalentes usado na busca de jogador.
+        
+        Returns:
+            Dicionário nickname (minúsculo) → tupla com ele mesmo seguido dos
+            nicknames ligados a ele por algum mapeamento
+        """
+        aliases: Dict[str, List[str]] = {}
+        for original, mapped in mappings.items():
+            original = _normalize_nickname(original)
+            mapped = _normalize_nickname(mapped)
+            aliases.setdefault(original, [original]).append(mapped)
+            if mapped != original:
+                aliases.setdefault(mapped, [mapped]).append(original)
+        return {name: tuple(targets) for name, targets in aliases.items()}
+    
     def _load_heroes_map(self) -> Dict[str, str]:
         """Carrega o mapeamento de heróis do arquivo heroes_map.json."""
         heroes_file = Path("heroes_map.json")
@@ -1228,8 +1831,8 @@ class MLBBExtractor:
     
     def _apply_nickname_mapping(self, nickname: str) -> str:
         """Aplica mapeamento de nickname se existir."""
-        if nickname in self.nickname_mappings:
-            mapped = self.nickname_mappings[nickname]
+        mapped = self.nickname_mappings.get(nickname)
+        if mapped is not None:
             if self.config.debug_mode:
                 print(f"  → Mapeamento aplicado: '{nickname}' → '{mapped}'")
             return mapped
@@ -1238,10 +1841,10 @@ class MLBBExtractor:
     def _clean_nickname(self, text: str) -> str:
         """Limpa nickname extraído."""
         cleaned = text.strip()
-        cleaned = re.sub(r'^[@#$%^&*()_+=\[\]{}|\\<>/?`~]+', '', cleaned)
-        cleaned = re.sub(r'[@#$%^&*()_+=\[\]{}|\\<>/?`~]+$', '', cleaned)
+        cleaned = _NICK_LEADING_SYMBOLS_RE.sub('', cleaned)
+        cleaned = _NICK_TRAILING_SYMBOLS_RE.sub('', cleaned)
         # Substituir quebras de linha por espaço para juntar tag do clã + nickname
         cleaned = cleaned.replace('\n', ' ').replace('\r', '')
         # Remover múltiplos espaços consecutivos
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned)
         return cleaned.strip()
@@ -47,7 +47,32 @@ class ImagePreprocessor:
         Raises:
             FileNotFoundError: If image file doesn't exist
         """
-        image = cv2.imread(image_path)
+        # np.fromfile + imdecode reads the file once and, unlike cv2.imread,
+        # handles non-ASCII paths on Windows
+        try:
+            buffer = np.fromfile(image_path, dtype=np.uint8)
+        except OSError:
+            buffer = None
+        return self.decode_image(buffer, image_path)
+
+    def decode_image(self, data, image_path: str = "<memory>") -> np.ndarray:
+        """
+        Decode an encoded image (PNG/JPEG bytes) already read from disk.
+
+        Args:
+            data: File contents as ``bytes`` or a uint8 array
+            image_path: Source path, used in the error message
+
+        Returns:
+            Decoded BGR image
+
+        Raises:
+            FileNotFoundError: If the data is missing or cannot be decoded
+        """
+        image = None
+        if data is not None and len(data):
+            buffer = np.frombuffer(data, dtype=np.uint8)
+            image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
         if image is None:
             raise FileNotFoundError(f"Could not load image from {image_path}")
         return image
@@ -67,7 +92,10 @@ class ImagePreprocessor:
         return image
 
     def apply_threshold(
-        self, image: np.ndarray, threshold_type: str = "adaptive"
+        self,
+        image: np.ndarray,
+        threshold_type: str = "adaptive",
+        dst: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Apply thresholding to enhance text regions.
@@ -75,19 +103,23 @@ class ImagePreprocessor:
         Args:
             image: Input grayscale image
             threshold_type: Type of thresholding ('binary', 'adaptive', 'otsu')
+            dst: Optional output buffer (may be ``image`` itself for in-place)
 
         Returns:
             Thresholded image
         """
         if threshold_type == "binary":
-            _, thresh = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
+            _, thresh = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY, dst=dst)
             return thresh
         elif threshold_type == "otsu":
-            _, thresh = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            _, thresh = cv2.threshold(
+                image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=dst
+            )
             return thresh
         else:  # adaptive
             return cv2.adaptiveThreshold(
-                image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+                image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2,
+                dst=dst
             )
 
     def denoise(self, image: np.ndarray) -> np.ndarray:
@@ -206,8 +238,9 @@ class ImagePreprocessor:
         if apply_denoise:
             resized = self.denoise(resized)
         
-        # Apply thresholding
-        processed = self.apply_threshold(resized, threshold_type)
+        # Apply thresholding in place: the upscaled buffer is the largest
+        # intermediate and is not needed afterwards
+        processed = self.apply_threshold(resized, threshold_type, dst=resized)
         
         return processed
 
@@ -312,7 +345,7 @@ class ImagePreprocessor:
             gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
         else:
             gray = region
-        inverted = 255 - gray
+        inverted = cv2.bitwise_not(gray)
         scaled = cv2.resize(inverted, None, fx=scale_factor, fy=scale_factor,
                            interpolation=cv2.INTER_CUBIC)
         return scaled
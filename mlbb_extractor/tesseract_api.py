@@ -0,0 +1,171 @@
+"""
+Acesso in-process ao Tesseract via tesserocr.
+
+O pytesseract executa um processo ``tesseract`` por chamada (gravando a
+imagem em um arquivo temporário e recarregando o modelo de idioma a cada
+vez). Quando o pacote opcional ``tesserocr`` está instalado, este módulo
+mantém uma única instância da API C do Tesseract e a reutiliza em todas as
+chamadas, aceitando as mesmas strings de configuração do pytesseract.
+"""
+
+import shlex
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import tesserocr
+    from tesserocr import RIL, iterate_level
+except ImportError:  # tesserocr é opcional
+    tesserocr = None
+
+TESSEROCR_AVAILABLE = tesserocr is not None
+
+# Campos retornados por image_to_data (mesmos nomes do pytesseract)
+_DATA_FIELDS = (
+    "text", "left", "top", "width", "height", "conf",
+    "block_num", "par_num", "line_num", "word_num",
+)
+
+
+def tesseract_version() -> str:
+    """Retorna a versão da biblioteca do Tesseract usada pelo tesserocr."""
+    return tesserocr.tesseract_version()
+
+
+def parse_tesseract_config(config: str) -> Tuple[Optional[int], Dict[str, str]]:
+    """
+    Interpreta uma string de configuração no formato do pytesseract.
+
+    Args:
+        config: Configuração (ex: "--psm 7 -c tessedit_char_whitelist=0123456789")
+
+    Returns:
+        Tupla (PSM ou None, variáveis ``-c nome=valor``)
+    """
+    psm = None
+    variables: Dict[str, str] = {}
+    tokens = shlex.split(config)
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == "--psm" and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 1
+        elif token == "-c" and i + 1 < len(tokens):
+            name, _, value = tokens[i + 1].partition("=")
+            variables[name] = value
+            i += 1
+        i += 1
+    return psm, variables
+
+
+class TesseractAPI:
+    """
+    Instância persistente da API do Tesseract (tesserocr).
+
+    Os métodos ``image_to_string`` e ``image_to_data`` espelham os do
+    pytesseract para que o extrator possa usar qualquer um dos dois.
+    Não é thread-safe: use uma instância por thread.
+    """
+
+    def __init__(self, lang: str = "eng"):
+        """
+        Inicializa a API.
+
+        Args:
+            lang: Idioma do modelo do Tesseract
+
+        Raises:
+            ImportError: Se o tesserocr não estiver instalado
+        """
+        if not TESSEROCR_AVAILABLE:
+            raise ImportError("tesserocr não está instalado")
+        self._api = tesserocr.PyTessBaseAPI(lang=lang)
+        # Valor original de cada variável já alterada por ``-c`` e variáveis
+        # definidas pela última chamada (restauradas na chamada seguinte)
+        self._defaults: Dict[str, str] = {}
+        self._last_variables: Tuple[str, ...] = ()
+
+    def _configure(self, image: np.ndarray, config: str) -> None:
+        """Aplica a configuração e define a imagem a ser reconhecida."""
+        psm, variables = parse_tesseract_config(config)
+        # Sem --psm, o mesmo padrão do executável tesseract (PSM 3)
+        self._api.SetPageSegMode(psm if psm is not None else tesserocr.PSM.AUTO)
+        
+        # Cada chamada começa da configuração padrão: as variáveis da chamada
+        # anterior que não aparecem nesta voltam ao valor original
+        for name in self._last_variables:
+            if name not in variables:
+                self._api.SetVariable(name, self._defaults[name])
+        for name, value in variables.items():
+            if name not in self._defaults:
+                self._defaults[name] = self._api.GetVariableAsString(name) or ""
+            self._api.SetVariable(name, value)
+        self._last_variables = tuple(variables)
+
+        # Os pixels são passados direto ao Tesseract, sem criar uma imagem PIL
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        self._api.SetImageBytes(
+            image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel
+        )
+
+    def image_to_string(self, image: np.ndarray, config: str = "") -> str:
+        """Reconhece o texto de uma imagem."""
+        self._configure(image, config)
+        return self._api.GetUTF8Text()
+
+    def image_to_data(self, image: np.ndarray, config: str = "") -> Dict[str, List]:
+        """
+        Reconhece as palavras de uma imagem com suas posições.
+
+        Returns:
+            Dicionário no formato ``pytesseract.Output.DICT`` (apenas níveis
+            de palavra)
+        """
+        self._configure(image, config)
+        self._api.Recognize()
+
+        data: Dict[str, List] = {field: [] for field in _DATA_FIELDS}
+        iterator = self._api.GetIterator()
+        if iterator is None:
+            return data
+
+        block = par = line = word = 0
+        for it in iterate_level(iterator, RIL.WORD):
+            if it.IsAtBeginningOf(RIL.BLOCK):
+                block += 1
+                par = line = 0
+            if it.IsAtBeginningOf(RIL.PARA):
+                par += 1
+                line = 0
+            if it.IsAtBeginningOf(RIL.TEXTLINE):
+                line += 1
+                word = 0
+            word += 1
+
+            box = it.BoundingBox(RIL.WORD)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            data["text"].append(it.GetUTF8Text(RIL.WORD) or "")
+            data["left"].append(x1)
+            data["top"].append(y1)
+            data["width"].append(x2 - x1)
+            data["height"].append(y2 - y1)
+            data["conf"].append(it.Confidence(RIL.WORD))
+            data["block_num"].append(block)
+            data["par_num"].append(par)
+            data["line_num"].append(line)
+            data["word_num"].append(word)
+
+        return data
+
+    def end(self) -> None:
+        """Libera a API do Tesseract."""
+        self._api.End()
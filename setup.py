@@ -34,9 +34,15 @@ setup(
         "pytesseract>=0.3.10",
         "numpy>=1.24.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "tesserocr>=2.6.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
-            "mlbb-extract=main:main",
+            "mlbb-extract=mlbb_extractor.cli:main",
         ],
     },
     keywords="mlbb mobile-legends ocr image-processing data-extraction screenshot",
@@ -0,0 +1,11 @@
+"""Configuração compartilhada dos testes."""
+
+import os
+import sys
+from pathlib import Path
+
+# Os testes não dependem do executável do Tesseract: o aquecimento é
+# desativado e as chamadas de OCR são substituídas por stubs
+os.environ.setdefault("MLBB_SKIP_WARMUP", "1")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,126 @@
+"""Testes da gravação incremental dos resultados do lote."""
+
+import json
+from argparse import Namespace
+
+import pytest
+
+from mlbb_extractor import cli
+from mlbb_extractor.cli import _BulkWriter, export_json
+
+
+RESULTS = [
+    {"source_file": "a.png", "score": 12.5, "kda": [3, 1, 7], "is_mvp": True},
+    {"source_file": "ação.jpg", "nick": "ナルト", "items": [], "extra": {}},
+    {"source_file": "c.png", "my_team": [{"player": "x", "gold": 9123}], "note": "a\nb"},
+]
+
+
+def _write_all(path, results, ndjson=False):
+    writer = _BulkWriter(path, ndjson=ndjson)
+    try:
+        for result in results:
+            writer.write(result)
+    finally:
+        writer.close()
+    return path.read_bytes()
+
+
+@pytest.fixture(params=["json", "orjson"])
+def serializer(request, monkeypatch):
+    """Executa o teste com o fallback json e, se instalado, com orjson."""
+    if request.param == "json":
+        monkeypatch.setattr(cli, "orjson", None)
+    elif cli.orjson is None:
+        pytest.skip("orjson não instalado")
+    return request.param
+
+
+@pytest.mark.parametrize("count", [0, 1, len(RESULTS)])
+def test_json_array_matches_export_json(tmp_path, serializer, count):
+    results = RESULTS[:count]
+    written = _write_all(tmp_path / "bulk.json", results)
+    exported = tmp_path / "export.json"
+    export_json(results, str(tmp_path), "export")
+    assert written == exported.read_bytes()
+    assert json.loads(written) == results
+
+
+@pytest.mark.parametrize("count", [0, 1, len(RESULTS)])
+def test_json_array_matches_json_dump(tmp_path, monkeypatch, count):
+    monkeypatch.setattr(cli, "orjson", None)
+    results = RESULTS[:count]
+    written = _write_all(tmp_path / "bulk.json", results)
+    assert written == json.dumps(results, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_ndjson_one_result_per_line(tmp_path, serializer):
+    written = _write_all(tmp_path / "bulk.ndjson", RESULTS, ndjson=True)
+    lines = written.split(b"\n")
+    assert lines[-1] == b""
+    assert [json.loads(line) for line in lines[:-1]] == RESULTS
+
+
+def test_ndjson_without_results_is_empty(tmp_path):
+    assert _write_all(tmp_path / "bulk.ndjson", [], ndjson=True) == b""
+
+
+def test_writer_creates_output_directory(tmp_path):
+    path = tmp_path / "novo" / "dir" / "bulk.json"
+    _write_all(path, RESULTS[:1])
+    assert json.loads(path.read_bytes()) == RESULTS[:1]
+
+
+class _FakeExtractor:
+    """Extrator mínimo para exercitar o processamento de diretório."""
+    
+    class preprocessor:
+        @staticmethod
+        def decode_image(data, path):
+            return None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _directory_args(tmp_path, ndjson=False):
+    images = tmp_path / "imagens"
+    images.mkdir()
+    for name in ("1.png", "2.JPG"):
+        (images / name).write_bytes(b"")
+    return Namespace(
+        directory=str(images), output=str(tmp_path / "saida"), name="lote",
+        workers=1, debug=False, ndjson=ndjson, all_players=True,
+    )
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_bulk_file_removed_when_nothing_extracted(tmp_path, monkeypatch, ndjson):
+    args = _directory_args(tmp_path, ndjson=ndjson)
+    monkeypatch.setattr(cli, "create_extractor", lambda args: _FakeExtractor())
+    monkeypatch.setattr(
+        cli, "_extract_image",
+        lambda extractor, image_file, args, image=None: (None, "  ✗ Nenhum dado extraído"),
+    )
+    
+    assert cli.extract_from_directory(args) == 1
+    assert list((tmp_path / "saida").iterdir()) == []
+
+
+def test_bulk_file_kept_with_results(tmp_path, monkeypatch):
+    args = _directory_args(tmp_path)
+    monkeypatch.setattr(cli, "create_extractor", lambda args: _FakeExtractor())
+    
+    def extract(extractor, image_file, args, image=None):
+        if image_file.name == "1.png":
+            return None, "  ✗ Nenhum dado extraído"
+        return {"source_file": image_file.name, "my_team": [{}]}, "  ✓"
+    
+    monkeypatch.setattr(cli, "_extract_image", extract)
+    
+    assert cli.extract_from_directory(args) == 0
+    output = tmp_path / "saida" / "lote_bulk.json"
+    assert json.loads(output.read_bytes()) == [{"source_file": "2.JPG", "my_team": [{}]}]
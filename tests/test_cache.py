@@ -0,0 +1,69 @@
+"""Testes do cache de OCR em disco."""
+
+import os
+
+import pytest
+
+from mlbb_extractor.cache import DiskCache
+
+
+def _files(cache_dir):
+    return sorted(p.name for p in cache_dir.rglob("*") if p.is_file())
+
+
+def test_missing_key_returns_none(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    assert cache.get("inexistente") is None
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.set("chave", "12.5")
+    assert cache.get("chave") == "12.5"
+    assert cache.get("outra chave") is None
+
+
+def test_round_trip_preserves_text(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    value = "ÆSIR\nナルト 龍\n"
+    cache.set("nick", value)
+    assert cache.get("nick") == value
+    cache.set("vazio", "")
+    assert cache.get("vazio") == ""
+
+
+def test_overwrite(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.set("chave", "antigo")
+    cache.set("chave", "novo")
+    assert cache.get("chave") == "novo"
+    assert len(_files(tmp_path / "cache")) == 1
+
+
+def test_entries_persist_across_instances(tmp_path):
+    DiskCache(str(tmp_path / "cache")).set("chave", "valor")
+    assert DiskCache(str(tmp_path / "cache")).get("chave") == "valor"
+
+
+def test_no_temp_files_left_after_set(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert not [name for name in _files(tmp_path / "cache") if name.endswith(".tmp")]
+
+
+def test_failed_replace_removes_temp_file(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.set("chave", "antigo")
+    
+    def failing_replace(src, dst):
+        raise OSError("disco cheio")
+    
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disco cheio"):
+        cache.set("chave", "novo")
+    
+    assert not [name for name in _files(tmp_path / "cache") if name.endswith(".tmp")]
+    monkeypatch.undo()
+    # A entrada anterior continua intacta
+    assert cache.get("chave") == "antigo"
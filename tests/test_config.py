@@ -0,0 +1,225 @@
+"""Testes do registro de perfis e das memoizações da configuração."""
+
+import dataclasses
+import json
+
+import pytest
+
+from mlbb_extractor.config import (
+    DEFAULT_PROFILE,
+    ExtractorConfig,
+    ProfileRegistry,
+    ResolutionProfile,
+)
+
+
+def _profile_data(name, width, height):
+    data = DEFAULT_PROFILE.to_dict()
+    data.update(name=name, description=f"Perfil {name}",
+                reference_width=width, reference_height=height)
+    return data
+
+
+def _profile(name, width, height):
+    return ResolutionProfile.from_dict(_profile_data(name, width, height))
+
+
+# ----------------------------------------------------------------------------
+# ProfileRegistry
+# ----------------------------------------------------------------------------
+
+def test_raw_profile_is_built_on_first_access():
+    registry = ProfileRegistry()
+    data = _profile_data("16x9", 1920, 1080)
+    registry.add_raw(data)
+    assert isinstance(registry._entries["16x9"], dict)
+    
+    profile = registry["16x9"]
+    assert isinstance(profile, ResolutionProfile)
+    assert profile == ResolutionProfile.from_dict(data)
+    assert registry._entries["16x9"] is profile
+    # Acessos seguintes reaproveitam o perfil construído
+    assert registry["16x9"] is profile
+
+
+def test_raw_profile_dict_is_not_modified():
+    registry = ProfileRegistry()
+    data = _profile_data("16x9", 1920, 1080)
+    expected = json.loads(json.dumps(data))
+    registry.add_raw(data)
+    registry["16x9"]
+    assert data == expected
+
+
+def test_reference_size_does_not_build_profile():
+    registry = ProfileRegistry()
+    registry.add_raw(_profile_data("4x3", 1440, 1080))
+    registry["16x9"] = _profile("16x9", 1920, 1080)
+    
+    assert registry.reference_size("4x3") == (1440, 1080)
+    assert isinstance(registry._entries["4x3"], dict)
+    assert registry.reference_size("16x9") == (1920, 1080)
+    with pytest.raises(KeyError):
+        registry.reference_size("inexistente")
+
+
+def test_version_changes_on_every_modification():
+    registry = ProfileRegistry()
+    versions = [registry.version]
+    
+    registry.add_raw(_profile_data("a", 1920, 1080))
+    versions.append(registry.version)
+    registry["b"] = _profile("b", 1440, 1080)
+    versions.append(registry.version)
+    registry["b"] = _profile("b", 1280, 720)
+    versions.append(registry.version)
+    del registry["a"]
+    versions.append(registry.version)
+    
+    assert len(set(versions)) == len(versions)
+
+
+def test_reads_do_not_change_version():
+    registry = ProfileRegistry()
+    registry.add_raw(_profile_data("a", 1920, 1080))
+    version = registry.version
+    
+    registry["a"]
+    registry.reference_size("a")
+    list(registry.items())
+    assert "a" in registry and len(registry) == 1
+    assert registry.version == version
+
+
+def test_mapping_interface():
+    registry = ProfileRegistry()
+    registry.add_raw(_profile_data("a", 1920, 1080))
+    registry["b"] = _profile("b", 1440, 1080)
+    
+    assert list(registry) == ["a", "b"]
+    assert "a" in registry and "c" not in registry
+    del registry["a"]
+    assert list(registry.keys()) == ["b"]
+    with pytest.raises(KeyError):
+        registry["a"]
+
+
+# ----------------------------------------------------------------------------
+# ExtractorConfig
+# ----------------------------------------------------------------------------
+
+def test_active_profile_is_memoized():
+    config = ExtractorConfig()
+    assert config.active_profile is config.active_profile
+    assert config.active_profile is DEFAULT_PROFILE
+
+
+def test_active_profile_follows_active_name():
+    config = ExtractorConfig()
+    config.add_profile(_profile("16x9", 1920, 1080))
+    config.active_profile  # popula o cache
+    
+    config.set_active_profile("16x9")
+    assert config.active_profile.name == "16x9"
+
+
+def test_active_profile_refreshed_when_replaced_with_same_name():
+    config = ExtractorConfig()
+    config.add_profile(_profile("16x9", 1920, 1080))
+    config.set_active_profile("16x9")
+    old = config.active_profile
+    
+    new = dataclasses.replace(old, description="Atualizado")
+    config.add_profile(new)
+    assert config.active_profile is new
+
+
+def test_active_profile_refreshed_after_reload(tmp_path):
+    path = tmp_path / "config.json"
+    config = ExtractorConfig()
+    config.add_profile(_profile("16x9", 1920, 1080))
+    config.set_active_profile("16x9")
+    config.save_to_file(str(path))
+    assert config.active_profile.description == "Perfil 16x9"
+    
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["profiles"][-1]["description"] = "Editado"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    config.load_from_file(str(path))
+    assert config.active_profile.description == "Editado"
+
+
+def test_auto_select_picks_closest_aspect_ratio():
+    config = ExtractorConfig()
+    config.add_profile(_profile("16x9", 1920, 1080))
+    config.add_profile(_profile("4x3", 1440, 1080))
+    
+    assert config.auto_select_profile(1280, 720) == "16x9"
+    assert config.active_profile_name == "16x9"
+    assert config.auto_select_profile(1024, 768) == "4x3"
+    assert config.auto_select_profile(2400, 1080) == DEFAULT_PROFILE.name
+
+
+def test_auto_select_memo_sets_active_profile():
+    config = ExtractorConfig()
+    config.add_profile(_profile("16x9", 1920, 1080))
+    
+    assert config.auto_select_profile(1280, 720) == "16x9"
+    config.set_active_profile(DEFAULT_PROFILE.name)
+    # Resposta memoizada ainda atualiza o perfil ativo
+    assert config.auto_select_profile(1280, 720) == "16x9"
+    assert config.active_profile_name == "16x9"
+
+
+def test_auto_select_memo_invalidated_when_profiles_change():
+    config = ExtractorConfig()
+    config.add_profile(_profile("5x4", 1350, 1080))
+    assert config.auto_select_profile(1280, 720) == DEFAULT_PROFILE.name
+    
+    config.add_profile(_profile("16x9", 1920, 1080))
+    assert config.auto_select_profile(1280, 720) == "16x9"
+    
+    config.set_active_profile(DEFAULT_PROFILE.name)
+    config.remove_profile("16x9")
+    assert config.auto_select_profile(1280, 720) == DEFAULT_PROFILE.name
+
+
+def test_auto_select_does_not_build_profiles(tmp_path):
+    path = tmp_path / "config.json"
+    source = ExtractorConfig()
+    source.add_profile(_profile("16x9", 1920, 1080))
+    source.add_profile(_profile("4x3", 1440, 1080))
+    source.save_to_file(str(path))
+    
+    config = ExtractorConfig(str(path))
+    assert config.auto_select_profile(1280, 720) == "16x9"
+    assert isinstance(config.profiles._entries["4x3"], dict)
+
+
+def test_loaded_profiles_do_not_share_cached_data(tmp_path):
+    path = tmp_path / "config.json"
+    source = ExtractorConfig()
+    source.add_profile(_profile("16x9", 1920, 1080))
+    source.save_to_file(str(path))
+    
+    first = ExtractorConfig(str(path))
+    first.profiles._entries["16x9"]["description"] = "Alterado"
+    second = ExtractorConfig(str(path))
+    assert second.profiles["16x9"].description == "Perfil 16x9"
+
+
+@pytest.mark.parametrize("size", [1920, 1920.5])
+def test_positive_reference_sizes_accepted(tmp_path, size):
+    path = tmp_path / "config.json"
+    data = {"profiles": [_profile_data("16x9", size, 1080)]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert ExtractorConfig(str(path)).profiles.reference_size("16x9") == (size, 1080)
+
+
+@pytest.mark.parametrize("size", [0, -1, True, "1920", None])
+def test_invalid_reference_sizes_rejected(tmp_path, size):
+    path = tmp_path / "config.json"
+    data = {"profiles": [_profile_data("16x9", size, 1080)]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(ValueError, match="reference_width"):
+        ExtractorConfig(str(path))
@@ -0,0 +1,58 @@
+"""Testes da exportação de resultados e da criação dos diretórios de saída."""
+
+import json
+import shutil
+
+from mlbb_extractor import cli
+from mlbb_extractor.cli import _BulkWriter, export_json
+
+
+DATA = {"result": "VICTORY", "my_team": []}
+
+
+def test_export_creates_directory(tmp_path):
+    path = export_json(DATA, str(tmp_path / "a" / "b"), "x")
+    assert json.loads((tmp_path / "a" / "b" / "x.json").read_bytes()) == DATA
+    assert path == str(tmp_path / "a" / "b" / "x.json")
+
+
+def test_export_after_directory_removed(tmp_path):
+    out = tmp_path / "out"
+    export_json(DATA, str(out), "x")
+    shutil.rmtree(out)
+    
+    export_json(DATA, str(out), "x")
+    assert json.loads((out / "x.json").read_bytes()) == DATA
+
+
+def test_bulk_writer_after_directory_removed(tmp_path):
+    out = tmp_path / "out"
+    export_json(DATA, str(out), "x")
+    shutil.rmtree(out)
+    
+    writer = _BulkWriter(out / "lote_bulk.json")
+    writer.write(DATA)
+    writer.close()
+    assert json.loads((out / "lote_bulk.json").read_bytes()) == [DATA]
+
+
+def test_relative_directory_follows_cwd(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    
+    monkeypatch.chdir(first)
+    export_json(DATA, "out", "x")
+    monkeypatch.chdir(second)
+    export_json(DATA, "out", "x")
+    assert (first / "out" / "x.json").exists()
+    assert (second / "out" / "x.json").exists()
+
+
+def test_main_clears_directory_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "list_profiles", lambda: 0)
+    export_json(DATA, str(tmp_path / "out"), "x")
+    assert cli._dir_cache
+    
+    assert cli.main(["--list-profiles"]) == 0
+    assert not cli._dir_cache
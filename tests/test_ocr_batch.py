@@ -0,0 +1,182 @@
+"""Testes do OCR em lote (empilhamento das regiões e redistribuição das palavras)."""
+
+import numpy as np
+import pytest
+
+from mlbb_extractor.config import ExtractorConfig
+from mlbb_extractor.extractor.mlbb_extractor import MLBBExtractor
+
+
+def _empty_data():
+    return {key: [] for key in (
+        "text", "left", "top", "width", "height", "conf",
+        "block_num", "par_num", "line_num", "word_num",
+    )}
+
+
+def _add_word(data, text, top, height, left=0, width=10, line=1):
+    data["text"].append(text)
+    data["left"].append(left)
+    data["top"].append(top)
+    data["width"].append(width)
+    data["height"].append(height)
+    data["conf"].append(90)
+    data["block_num"].append(1)
+    data["par_num"].append(1)
+    data["line_num"].append(line)
+    data["word_num"].append(len(data["text"]))
+
+
+def _stub_by_pixels(stack, config):
+    """
+    Simula o Tesseract: cada faixa contínua de linhas com o mesmo valor não
+    nulo vira uma palavra ``v<valor>`` com a posição da faixa.
+    """
+    data = _empty_data()
+    row_values = stack.max(axis=1)
+    start = None
+    for y in range(len(row_values) + 1):
+        value = row_values[y] if y < len(row_values) else 0
+        if start is not None and value != row_values[start]:
+            _add_word(data, f"v{row_values[start]}", start, y - start)
+            start = None
+        if start is None and value:
+            start = y
+    return data
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with MLBBExtractor(config=ExtractorConfig()) as extractor:
+        yield extractor
+
+
+def _crop(height, width, value):
+    return np.full((height, width), value, dtype=np.uint8)
+
+
+def test_words_return_to_their_region(extractor, monkeypatch):
+    monkeypatch.setattr(extractor, "_image_to_data", _stub_by_pixels)
+    crops = [_crop(12, 30, 50), _crop(7, 30, 100), _crop(25, 30, 150)]
+    assert extractor._ocr_batch(crops, "--psm 6") == ["v50", "v100", "v150"]
+
+
+def test_crops_of_different_widths_are_padded(extractor, monkeypatch):
+    stacks = []
+    
+    def stub(stack, config):
+        stacks.append(stack)
+        return _stub_by_pixels(stack, config)
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    crops = [_crop(10, 5, 60), _crop(10, 40, 120), _crop(10, 17, 180)]
+    assert extractor._ocr_batch(crops, "--psm 6") == ["v60", "v120", "v180"]
+    
+    separator = MLBBExtractor.OCR_BATCH_SEPARATOR
+    assert stacks[0].shape == (3 * (10 + separator), 40)
+    # Preenchimento preto à direita das regiões mais estreitas
+    assert not stacks[0][:10, 5:].any()
+
+
+def test_word_straddling_separator_goes_to_region_of_its_center(extractor, monkeypatch):
+    separator = MLBBExtractor.OCR_BATCH_SEPARATOR
+    second_start = 10 + separator
+    
+    def stub(stack, config):
+        data = _empty_data()
+        # Começa na 1ª região, mas o centro já está na faixa da 2ª
+        _add_word(data, "abaixo", top=8, height=2 * (second_start - 8) + 2)
+        # Começa no separador, com o centro ainda antes da 2ª região
+        _add_word(data, "acima", top=12, height=4, line=2)
+        return data
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    crops = [_crop(10, 20, 1), _crop(10, 20, 2)]
+    assert extractor._ocr_batch(crops, "--psm 6") == ["acima", "abaixo"]
+
+
+def test_lines_within_a_region_are_kept(extractor, monkeypatch):
+    def stub(stack, config):
+        data = _empty_data()
+        _add_word(data, "TAG", top=1, height=4, line=1)
+        _add_word(data, "nick", top=6, height=4, line=2)
+        _add_word(data, "name", top=6, height=4, left=20, line=2)
+        _add_word(data, "  ", top=6, height=4, left=40, line=2)
+        return data
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    assert extractor._ocr_batch([_crop(12, 50, 1)], "--psm 6") == ["TAG\nnick name"]
+
+
+def test_empty_crops(extractor, monkeypatch):
+    monkeypatch.setattr(extractor, "_image_to_data", _stub_by_pixels)
+    crops = [_crop(10, 20, 70), _crop(0, 20, 0), _crop(10, 20, 140)]
+    assert extractor._ocr_batch(crops, "--psm 6") == ["v70", "", "v140"]
+    assert extractor._ocr_batch([], "--psm 6") == []
+
+
+def test_only_zero_width_crops_skip_tesseract(extractor, monkeypatch):
+    def stub(stack, config):
+        raise AssertionError("Tesseract não deveria ser chamado")
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    assert extractor._ocr_batch([_crop(5, 0, 0), _crop(0, 0, 0)], "--psm 6") == ["", ""]
+
+
+def test_prefetch_groups_by_whitelist_and_feeds_ocr(extractor, monkeypatch):
+    calls = []
+    
+    def stub(stack, config):
+        calls.append(config)
+        return _stub_by_pixels(stack, config)
+    
+    def no_tesseract(image, config):
+        raise AssertionError("o resultado deveria vir do lote")
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    monkeypatch.setattr(extractor, "_image_to_string", no_tesseract)
+    
+    score_a, score_b, ratio = _crop(10, 20, 30), _crop(8, 25, 60), _crop(9, 15, 90)
+    extractor._prefetch_ocr([
+        (score_a, MLBBExtractor.SCORE_OCR_CONFIG),
+        (ratio, MLBBExtractor.RATIO_OCR_CONFIG),
+        (score_b, MLBBExtractor.SCORE_OCR_CONFIG),
+    ])
+    
+    # Uma chamada por whitelist, sempre em PSM 6
+    assert sorted(calls) == sorted([
+        "--psm 6 -c tessedit_char_whitelist=0123456789",
+        "--psm 6 -c tessedit_char_whitelist=0123456789.",
+    ])
+    assert extractor._ocr(score_a, MLBBExtractor.SCORE_OCR_CONFIG) == "v30"
+    assert extractor._ocr(score_b, MLBBExtractor.SCORE_OCR_CONFIG) == "v60"
+    assert extractor._ocr(ratio, MLBBExtractor.RATIO_OCR_CONFIG) == "v90"
+
+
+def test_region_without_words_in_batch_falls_back_to_own_ocr(extractor, monkeypatch):
+    def stub(stack, config):
+        data = _stub_by_pixels(stack, config)
+        # A faixa do placar não rende palavras na leitura em bloco
+        keep = [i for i, text in enumerate(data["text"]) if text != "v60"]
+        return {field: [values[i] for i in keep] for field, values in data.items()}
+    
+    calls = []
+    
+    def image_to_string(image, config):
+        calls.append(config)
+        return "17"
+    
+    monkeypatch.setattr(extractor, "_image_to_data", stub)
+    monkeypatch.setattr(extractor, "_image_to_string", image_to_string)
+    
+    score_a, score_b = _crop(10, 20, 30), _crop(8, 25, 60)
+    extractor._prefetch_ocr([
+        (score_a, MLBBExtractor.SCORE_OCR_CONFIG),
+        (score_b, MLBBExtractor.SCORE_OCR_CONFIG),
+    ])
+    
+    assert extractor._ocr(score_a, MLBBExtractor.SCORE_OCR_CONFIG) == "v30"
+    assert calls == []
+    assert extractor._ocr(score_b, MLBBExtractor.SCORE_OCR_CONFIG) == "17"
+    assert calls == [MLBBExtractor.SCORE_OCR_CONFIG]
@@ -0,0 +1,82 @@
+"""Testes das chaves do cache em disco de resultados completos."""
+
+import numpy as np
+import pytest
+
+from mlbb_extractor.config import ExtractorConfig, ResolutionProfile
+from mlbb_extractor.extractor.mlbb_extractor import MLBBExtractor
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = ExtractorConfig()
+    config.cache_dir = str(tmp_path / "cache")
+    with MLBBExtractor(config=config) as extractor:
+        yield extractor
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 256, (108, 240, 3), dtype=np.uint8)
+
+
+def test_same_settings_hit(extractor, image):
+    key = extractor._result_cache_key(image)
+    extractor.ocr_cache.set(key, "{}")
+    assert extractor._result_cache_key(image) == key
+    assert extractor.ocr_cache.get(extractor._result_cache_key(image)) == "{}"
+
+
+@pytest.mark.parametrize("option, value", [
+    ("batch_ocr", True),
+    ("use_tesserocr", False),
+    ("tesseract_cmd", "/opt/tesseract/bin/tesseract"),
+    ("fast_nickname_search", True),
+    ("downscale_large_images", True),
+])
+def test_changing_ocr_option_misses(extractor, image, option, value):
+    key = extractor._result_cache_key(image)
+    extractor.ocr_cache.set(key, "{}")
+    
+    setattr(extractor.config, option, value)
+    changed = extractor._result_cache_key(image)
+    assert changed != key
+    assert extractor.ocr_cache.get(changed) is None
+
+
+def test_changing_ocr_backend_misses(extractor, image, monkeypatch):
+    key = extractor._result_cache_key(image)
+    
+    monkeypatch.setattr(extractor, "_ocr_backend", lambda: "pytesseract tesseract 9.9")
+    extractor._result_cache_salt = None
+    assert extractor._result_cache_key(image) != key
+
+
+def test_changing_profiles_misses(extractor, image):
+    key = extractor._result_cache_key(image)
+    data = dict(extractor.config.active_profile.to_dict(), name="outro")
+    extractor.config.add_profile(ResolutionProfile.from_dict(data))
+    assert extractor._result_cache_key(image) != key
+
+
+def test_region_cache_key_includes_backend(extractor, monkeypatch):
+    calls = []
+    
+    def image_to_string(image, config):
+        calls.append(config)
+        return "42"
+    
+    monkeypatch.setattr(extractor, "_image_to_string", image_to_string)
+    region = np.zeros((10, 20), dtype=np.uint8)
+    assert extractor._ocr(region, "--psm 7") == "42"
+    
+    # Sem o cache em memória, o texto vem do disco
+    extractor._ocr_memory.clear()
+    assert extractor._ocr(region, "--psm 7") == "42"
+    assert len(calls) == 1
+    
+    extractor._ocr_memory.clear()
+    monkeypatch.setattr(extractor, "_ocr_backend", lambda: "pytesseract tesseract 9.9")
+    assert extractor._ocr(region, "--psm 7") == "42"
+    assert len(calls) == 2